@@ -0,0 +1,30 @@
+"""Shared pytest configuration for wikipedia-ingestion tests.
+
+Tests marked ``@pytest.mark.slow`` are skipped unless ``--runslow`` is passed.
+The option is only registered when pytest runs from this directory (or is
+given paths below it), since this file is not a conftest of the repo root.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow (skipped by default)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: marks tests as slow (run with --runslow)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -18,6 +18,17 @@ if TYPE_CHECKING:
     from historical_event import HistoricalEvent
 
 
+# Map confidence to span precision value
+# RomanEvent uses confidence levels; HistoricalEvent uses precision (0-100)
+_CONFIDENCE_PRECISION = {
+    ConfidenceLevel.EXPLICIT: 100.0,      # High precision
+    ConfidenceLevel.INFERRED: 75.0,       # Good precision
+    ConfidenceLevel.APPROXIMATE: 50.0,    # Medium precision
+    ConfidenceLevel.UNCERTAIN: 25.0,      # Low precision
+    ConfidenceLevel.LEGENDARY: 10.0,      # Very low precision
+}
+
+
 class EventCategory(Enum):
     """Categories for Roman historical events."""
     FOUNDING = "founding"                    # Rome founding and early kings
@@ -201,7 +212,8 @@ class RomanEvent:
         
         Args:
             url: Source URL for the event
-            span_match_notes: Optional notes about span matching/parsing
+            span_match_notes: Optional notes about span matching/parsing;
+                defaults to the event's original_text
             
         Returns:
             HistoricalEvent instance ready for JSON serialization
@@ -216,16 +228,7 @@ class RomanEvent:
         # Calculate weight (duration in days, or 1 day for point events)
         weight = 1  # Default to 1 day for single-date events
         
-        # Map confidence to span precision value
-        # RomanEvent uses confidence levels; HistoricalEvent uses precision (0-100)
-        precision_map = {
-            ConfidenceLevel.EXPLICIT: 100.0,      # High precision
-            ConfidenceLevel.INFERRED: 75.0,       # Good precision
-            ConfidenceLevel.APPROXIMATE: 50.0,    # Medium precision
-            ConfidenceLevel.UNCERTAIN: 25.0,      # Low precision
-            ConfidenceLevel.LEGENDARY: 10.0,      # Very low precision
-        }
-        precision = precision_map.get(self.confidence, 50.0)
+        precision = _CONFIDENCE_PRECISION.get(self.confidence, 50.0)
         
         return HistoricalEvent(
             title=self.title,
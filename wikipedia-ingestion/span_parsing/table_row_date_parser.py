@@ -59,6 +59,19 @@ class RowspanContext:
             self.remaining_rows -= 1
             return True
         return False
+    
+    def reset(
+        self,
+        inherited_year: int,
+        inherited_is_bc: bool,
+        remaining_rows: int,
+        source_row_index: int,
+    ) -> None:
+        """Start tracking a new rowspan in place, reusing this context."""
+        self.inherited_year = inherited_year
+        self.inherited_is_bc = inherited_is_bc
+        self.remaining_rows = remaining_rows
+        self.source_row_index = source_row_index
 
 
 class TableRowDateParser:
@@ -110,6 +123,12 @@ class TableRowDateParser:
             r'^(\d+)–(\d+)\s*(BC|AD|BCE|CE)?$',
             re.IGNORECASE
         )
+        
+        # Prefix designation: "AD 14" (normalized to "14 AD")
+        self.prefix_year_pattern = re.compile(
+            r'^(AD|BC|BCE|CE)\s+(\d+)$',
+            re.IGNORECASE
+        )
     
     def parse_year_cell(self, year_text: str) -> ParsedDate:
         """Parse year cell to extract year and BC/AD designation.
@@ -128,8 +147,18 @@ class TableRowDateParser:
         
         year_text = year_text.strip()
 
+        # Fast path for bare years like "100": no designation, so AD
+        if year_text.isdecimal():
+            year = int(year_text)
+            return ParsedDate(
+                year=year, month=None, day=None, is_bc=False,
+                precision=SpanPrecision.YEAR_ONLY,
+                confidence=self.determine_confidence_for_date(year),
+                original_text=year_text
+            )
+
         # Normalize prefix designations like "AD 14" -> "14 AD"
-        prefix_match = re.match(r'^(AD|BC|BCE|CE)\s+(\d+)$', year_text, re.IGNORECASE)
+        prefix_match = self.prefix_year_pattern.match(year_text)
         if prefix_match:
             designation = prefix_match.group(1)
             year_text = f"{prefix_match.group(2)} {designation}"
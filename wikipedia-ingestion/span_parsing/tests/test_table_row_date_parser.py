@@ -48,6 +48,14 @@ class TestParseYearCell:
         assert result.year == 100
         assert result.is_bc == False
     
+    def test_bare_year_zero_is_legendary(self):
+        """Test bare year 0 (doesn't exist): '0' → confidence=legendary"""
+        parser = TableRowDateParser()
+        result = parser.parse_year_cell("0")
+        assert result.year == 0
+        assert result.is_bc == False
+        assert result.confidence == ConfidenceLevel.LEGENDARY
+    
     def test_legendary_year_pre_753_bc(self):
         """Test legendary dates before Rome founding: '754 BC' → confidence=legendary"""
         parser = TableRowDateParser()
@@ -219,6 +227,29 @@ class TestRowspanContext:
         # All rows should show BC
         assert context.inherited_is_bc == True
         assert context.inherited_year < 0
+    
+    def test_reset_starts_new_rowspan(self):
+        """Test reset replaces an exhausted rowspan in place"""
+        context = RowspanContext(
+            inherited_year=27,
+            inherited_is_bc=True,
+            remaining_rows=0,
+            source_row_index=0
+        )
+        
+        context.reset(
+            inherited_year=14,
+            inherited_is_bc=False,
+            remaining_rows=1,
+            source_row_index=5
+        )
+        
+        assert context.inherited_year == 14
+        assert context.inherited_is_bc == False
+        assert context.source_row_index == 5
+        assert context.should_inherit() == True
+        assert context.consume_row() == True
+        assert context.should_inherit() == False
 
 
 class TestParseWithRowspanContext:
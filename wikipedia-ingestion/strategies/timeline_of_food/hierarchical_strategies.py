@@ -61,7 +61,20 @@ class TextSectionParser:
         Returns:
             List of TextSection objects representing the article structure
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        return self.parse_sections_from_soup(BeautifulSoup(html, 'lxml'))
+    
+    def parse_sections_from_soup(self, soup: BeautifulSoup) -> list[TextSection]:
+        """Parse all major sections from an already-parsed article.
+        
+        Lets callers that also need the document tree parse the HTML once
+        and share it. The soup is only read, never modified.
+        
+        Args:
+            soup: BeautifulSoup tree of the Wikipedia article
+        
+        Returns:
+            List of TextSection objects representing the article structure
+        """
         sections = []
         position = 0
         
@@ -1,6 +1,7 @@
 """Unit tests for TextSectionParser and hierarchical parsing."""
 
 import pytest
+from bs4 import BeautifulSoup
 from strategies.timeline_of_food.hierarchical_strategies import TextSectionParser, TextSection
 
 
@@ -225,6 +226,24 @@ class TestTextSectionParser:
         assert sections[2].name == "1900"
         assert sections[2].level == 2
 
+    def test_parse_sections_from_soup_matches_parse_sections(self):
+        """Parsing a pre-built soup should yield the same sections as parsing raw HTML."""
+        html = """
+        <html>
+        <body>
+            <h2 id="1800"><span class="mw-headline">1800</span></h2>
+            <ul><li>Event 1</li><li>Event 2</li></ul>
+            <h3 id="subsection"><span class="mw-headline">Subsection</span></h3>
+            <ul><li>Event 3</li></ul>
+        </body>
+        </html>
+        """
+        
+        parser = TextSectionParser()
+        soup = BeautifulSoup(html, 'lxml')
+        
+        assert parser.parse_sections_from_soup(soup) == parser.parse_sections(html)
+
     def test_parse_bc_range_heading(self):
         """BC range headings should convert to signed years with BC flags."""
         html = """
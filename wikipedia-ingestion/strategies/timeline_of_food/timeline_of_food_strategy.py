@@ -70,6 +70,9 @@ class TimelineOfFoodStrategy(IngestionStrategy):
         
         Uses ingestion_common.get_html() for consistent HTTP caching,
         retry logic, and content validation across all strategies.
+        Network requests go through the module-level WIKI_SESSION, so
+        repeated runs in one process reuse the same keep-alive connection
+        (and its gzip negotiation) rather than opening a new one per strategy.
         
         Returns:
             FetchResult with metadata about the fetch operation
@@ -120,13 +123,14 @@ class TimelineOfFoodStrategy(IngestionStrategy):
         log_info("Parsing Timeline of Food article")
         parse_start = datetime.utcnow()
         
+        # Parse the document once and share the tree between section and event extraction
+        soup = BeautifulSoup(self.html_content, 'lxml')
+        
         # Parse sections
-        self.sections = self.section_parser.parse_sections(self.html_content)
+        self.sections = self.section_parser.parse_sections_from_soup(soup)
         log_info(f"Found {len(self.sections)} sections")
         
         # Extract events from each section
-        soup = BeautifulSoup(self.html_content, 'html.parser')
-        
         for section in self.sections:
             section_events = self._extract_events_from_section(soup, section)
             self.events.extend(section_events)
@@ -8,21 +8,54 @@ Measures:
 4. Events per second throughput
 
 Target: <30 seconds total, >100 events/second
+
+Usage:
+    python performance_validation.py [--runs N] [--profile] [--out PATH]
+
+A machine-readable summary is written to --out (default
+/tmp/timeline_of_food_perf/report.json) so CI can track regressions.
+
+With at least 20 runs the total-time check uses the 95th percentile instead
+of the maximum, so a single cold outlier does not fail the validation.
+
+With --profile, each run's parse phase is wrapped in cProfile. The top 20
+functions by cumulative time are printed and the raw stats are written to
+/tmp/tof_parse_<run>.prof, which can be explored with:
+
+    snakeviz /tmp/tof_parse_1.prof
+
+Profiling adds overhead, so parse timings from a profiled run are inflated.
 """
 
+import argparse
+import cProfile
+import json
+import pstats
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from statistics import mean, stdev
+from statistics import mean, quantiles, stdev
 from datetime import datetime
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from strategies.strategy_base import FetchResult
 from strategies.timeline_of_food.timeline_of_food_strategy import TimelineOfFoodStrategy
 
 
+# Minimum number of samples before the p95 is meaningful
+MIN_RUNS_FOR_P95 = 20
+
+PERF_OUTPUT_DIR = Path("/tmp/timeline_of_food_perf")
+DEFAULT_REPORT_PATH = PERF_OUTPUT_DIR / "report.json"
+
+# Cap concurrent fetches so large --runs values don't hammer Wikipedia
+MAX_FETCH_WORKERS = 4
+
+
 class PerformanceTimer:
     """Context manager for timing operations."""
     
@@ -32,15 +65,84 @@ class PerformanceTimer:
         self.elapsed = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, *args):
-        self.elapsed = time.time() - self.start_time
+        self.elapsed = time.perf_counter() - self.start_time
+
+
+def _fetch_run(run: int) -> tuple[TimelineOfFoodStrategy, FetchResult, float]:
+    """Build a strategy for one run and time its fetch phase.
+    
+    Each run writes to its own output directory so concurrent runs
+    never share artifact paths.
+    """
+    run_id = datetime.now().strftime("%Y%m%dT%H%M%SZ")
+    output_dir = PERF_OUTPUT_DIR / f"run_{run}"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    strategy = TimelineOfFoodStrategy(run_id, output_dir)
+    
+    with PerformanceTimer("fetch") as timer:
+        fetch_result = strategy.fetch()
+    
+    return strategy, fetch_result, timer.elapsed
+
+
+def _summarize(times: list[float]) -> dict[str, float | None]:
+    """Compute mean/stddev/min/max/p95 for a list of timings.
+    
+    The mean is passed to stdev() as xbar so it is not recomputed. p95 is
+    None when there are too few samples for a percentile.
+    """
+    avg = mean(times)
+    return {
+        "runs": len(times),
+        "mean": avg,
+        "stddev": stdev(times, xbar=avg) if len(times) > 1 else 0.0,
+        "min": min(times),
+        "max": max(times),
+        "p95": quantiles(times, n=100)[94] if len(times) >= MIN_RUNS_FOR_P95 else None,
+    }
+
+
+def _print_summary(
+    title: str,
+    times: list[float],
+    show_runs: bool = True,
+    trailing_blank: bool = True,
+) -> dict[str, float | None]:
+    """Print one timing block of the performance report and return its stats."""
+    summary = _summarize(times)
+    print(title)
+    if show_runs:
+        print(f"  Runs: {summary['runs']}")
+    print(f"  Average: {summary['mean']:.2f}s")
+    if summary["runs"] > 1:
+        print(f"  StdDev: {summary['stddev']:.2f}s")
+    print(f"  Min: {summary['min']:.2f}s")
+    print(f"  Max: {summary['max']:.2f}s")
+    if summary["runs"] >= MIN_RUNS_FOR_P95:
+        print(f"  P95: {summary['p95']:.2f}s")
+    if trailing_blank:
+        print()
+    return summary
 
 
-def run_performance_validation(num_runs: int = 3):
-    """Run performance validation with multiple runs for averaging."""
+def run_performance_validation(
+    num_runs: int = 3,
+    profile: bool = False,
+    report_path: Path = DEFAULT_REPORT_PATH,
+):
+    """Run performance validation with multiple runs for averaging.
+    
+    Run 1 fetches on its own first, so a cold HTTP cache is filled by a
+    single request. Once it has, the remaining runs are cache hits and fetch
+    concurrently on a thread pool; if it failed they fetch one at a time, so
+    concurrent runs never race on the network, the shared session or the
+    cache file. Parsing is CPU bound and is timed sequentially afterwards so
+    that thread scheduling does not leak into the parse measurements.
+    """
     print("=" * 70)
     print("Timeline of Food - Performance Validation")
     print("=" * 70)
@@ -51,32 +153,46 @@ def run_performance_validation(num_runs: int = 3):
     total_times = []
     event_counts = []
     
-    for run in range(1, num_runs + 1):
+    futures = {}
+    cache_warm = False
+    if num_runs >= 1:
+        warm_up = Future()
+        try:
+            warm_up.set_result(_fetch_run(1))
+            cache_warm = bool(warm_up.result()[0].html_content)
+        except Exception as e:
+            warm_up.set_exception(e)
+        futures[1] = warm_up
+    
+    if num_runs > 1:
+        workers = min(num_runs - 1, MAX_FETCH_WORKERS) if cache_warm else 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for run in range(2, num_runs + 1):
+                futures[run] = executor.submit(_fetch_run, run)
+    
+    for run, future in futures.items():
         print(f"Run {run}/{num_runs}:")
         
-        run_id = datetime.now().strftime("%Y%m%dT%H%M%SZ")
-        output_dir = Path("/tmp/timeline_of_food_perf")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        strategy = TimelineOfFoodStrategy(run_id, output_dir)
-        
         try:
-            # Measure fetch time
-            with PerformanceTimer("fetch") as timer:
-                fetch_result = strategy.fetch()
-                html = strategy.html_content
+            strategy, fetch_result, fetch_time = future.result()
+            html = strategy.html_content
             
             if not html:
                 print(f"  ✗ Fetch failed")
                 continue
             
-            fetch_time = timer.elapsed
             fetch_times.append(fetch_time)
             html_size = len(html)
             print(f"  Fetch: {fetch_time:.2f}s ({html_size} bytes)")
             
             # Measure parse time
+            profiler = cProfile.Profile() if profile else None
             with PerformanceTimer("parse") as timer:
+                if profiler:
+                    profiler.enable()
                 parse_result = strategy.parse(fetch_result)
+                if profiler:
+                    profiler.disable()
             
             parse_time = timer.elapsed
             parse_times.append(parse_time)
@@ -93,6 +209,12 @@ def run_performance_validation(num_runs: int = 3):
                 throughput = len(events) / parse_time
                 print(f"  Throughput: {throughput:.0f} events/second")
             
+            if profiler:
+                prof_path = Path(f"/tmp/tof_parse_{run}.prof")
+                profiler.dump_stats(prof_path)
+                print(f"  Profile: {prof_path}")
+                pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+            
             print()
             
         except Exception as e:
@@ -109,43 +231,22 @@ def run_performance_validation(num_runs: int = 3):
     print("=" * 70)
     print()
     
-    # Fetch metrics
-    print("FETCH PHASE")
-    print(f"  Runs: {len(fetch_times)}")
-    print(f"  Average: {mean(fetch_times):.2f}s")
-    if len(fetch_times) > 1:
-        print(f"  StdDev: {stdev(fetch_times):.2f}s")
-    print(f"  Min: {min(fetch_times):.2f}s")
-    print(f"  Max: {max(fetch_times):.2f}s")
-    print()
-    
-    # Parse metrics
-    print("PARSE PHASE")
-    print(f"  Runs: {len(parse_times)}")
-    print(f"  Average: {mean(parse_times):.2f}s")
-    if len(parse_times) > 1:
-        print(f"  StdDev: {stdev(parse_times):.2f}s")
-    print(f"  Min: {min(parse_times):.2f}s")
-    print(f"  Max: {max(parse_times):.2f}s")
-    print()
-    
-    # Total time metrics
-    print("TOTAL TIME")
-    avg_total = mean(total_times)
-    print(f"  Average: {avg_total:.2f}s")
-    if len(total_times) > 1:
-        print(f"  StdDev: {stdev(total_times):.2f}s")
-    print(f"  Min: {min(total_times):.2f}s")
-    print(f"  Max: {max(total_times):.2f}s")
-    print(f"  Target: <30s")
-    total_check_passed = max(total_times) < 30.0
+    fetch_summary = _print_summary("FETCH PHASE", fetch_times)
+    parse_summary = _print_summary("PARSE PHASE", parse_times)
+    total_summary = _print_summary("TOTAL TIME", total_times, show_runs=False, trailing_blank=False)
+    # Below MIN_RUNS_FOR_P95 samples there is no p95, so check the max instead
+    check_stat = "p95" if total_summary["p95"] is not None else "max"
+    print(f"  Target: {check_stat.capitalize()} <30s")
+    total_check_passed = total_summary[check_stat] < 30.0
     print(f"  Result: {'✓ PASS' if total_check_passed else '✗ FAIL'}")
     print()
     
     # Throughput metrics
     print("THROUGHPUT")
     avg_events = mean(event_counts)
-    avg_throughput = mean([count / parse_time for count, parse_time in zip(event_counts, parse_times)])
+    # Time-weighted (pooled) throughput: total events over total parse time
+    total_parse_time = sum(parse_times)
+    avg_throughput = sum(event_counts) / total_parse_time if total_parse_time > 0 else float('inf')
     print(f"  Average events extracted: {avg_events:.0f}")
     print(f"  Average throughput: {avg_throughput:.0f} events/second")
     print(f"  Target: >100 events/second")
@@ -162,9 +263,62 @@ def run_performance_validation(num_runs: int = 3):
         print("✗ SOME PERFORMANCE CHECKS FAILED")
     print("=" * 70)
     
+    report = {
+        "fetch": fetch_summary,
+        "parse": parse_summary,
+        "total": total_summary,
+        "events": {
+            "mean": avg_events,
+            # Unbounded when parsing took no measurable time; JSON has no infinity
+            "throughput_per_second": avg_throughput if avg_throughput != float('inf') else None,
+        },
+        "checks": {
+            "total_time_stat": check_stat,
+            "total_time": total_check_passed,
+            "throughput": throughput_check_passed,
+        },
+        "pass": all_checks_passed,
+    }
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2, allow_nan=False)
+    print(f"Report written to {report_path}")
+    
     return all_checks_passed
 
 
-if __name__ == "__main__":
-    success = run_performance_validation()
+def main():
+    parser = argparse.ArgumentParser(
+        description="Performance validation for Timeline of Food ingestion"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help=f"Number of validation runs (default: 3; p95 is used from {MIN_RUNS_FOR_P95} runs)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the parse phase with cProfile and dump /tmp/tof_parse_<run>.prof"
+    )
+    
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_REPORT_PATH,
+        help=f"Path for the JSON report (default: {DEFAULT_REPORT_PATH})"
+    )
+    
+    args = parser.parse_args()
+    
+    success = run_performance_validation(
+        num_runs=args.runs,
+        profile=args.profile,
+        report_path=args.out,
+    )
     sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Shared fixtures for Timeline of Roman History strategy tests."""
+
+import pytest
+
+
+@pytest.fixture
+def mock_get_html(monkeypatch):
+    """Replace the strategy's network fetch with a canned response.
+    
+    Returns a setter taking (html, url="https://final.url", error=None); the
+    setter returns the list of recorded calls so tests can assert on fetch
+    behaviour.
+    """
+    calls = []
+    
+    def _set(html: str, url: str = "https://final.url", error: str | None = None) -> list:
+        def fake_get_html(*args, **kwargs):
+            calls.append((args, kwargs))
+            return ((html, url), error)
+        
+        monkeypatch.setattr(
+            'strategies.timeline_of_roman_history.timeline_of_roman_history_strategy.get_html',
+            fake_get_html,
+        )
+        return calls
+    
+    return _set
@@ -2,68 +2,172 @@
 
 import json
 import pytest
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 import jsonschema
 
 from strategies.timeline_of_roman_history.timeline_of_roman_history_strategy import (
     TimelineOfRomanHistoryStrategy
 )
-from strategies.strategy_base import FetchResult
+from strategies.strategy_base import ArtifactData, FetchResult
 
 
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+_SCHEMA_PATH = Path(__file__).resolve().parents[3] / "import_schema.json"
+
+# Fixed run_id shared by every strategy built in this module
+_RUN_ID = "20260101T000000Z"
+
+# Fields every serialized event must carry
+_REQUIRED_FIELDS = (
+    "title", "start_year", "end_year", "is_bc_start", "is_bc_end",
+    "precision", "weight", "url", "span_match_notes", "description", "category"
+)
+
+# Fields that may legitimately be None
+_OPTIONAL_FIELDS = frozenset({"start_month", "start_day", "end_month", "end_day", "_debug_extraction"})
+
+_REQUIRED_NONNULL = tuple(f for f in _REQUIRED_FIELDS if f not in _OPTIONAL_FIELDS)
+
+# Event fields compared against the expected-events fixtures
+_DATE_COMPARE_KEYS = ("title", "start_year", "end_year", "is_bc_start", "is_bc_end")
+_COMPARE_KEYS = _DATE_COMPARE_KEYS + ("description",)
+
+
+# (title fragment, expected is_bc_start, fragment that flips the expectation or None)
+# for known 1st century AD fixture events
+_EXPECTED_BC_BY_TITLE = (
+    ("Caesar", True, None),  # Gaius Julius Caesar born 100 BC
+    # "granted the title"/"celebrates his birthday" are 27 BC; "Death of Augustus" is AD 14
+    ("Augustus", True, "Death"),
+    ("Jesus", False, None),  # AD 33
+    ("Crucifixion", False, None),  # AD 33
+    ("Vesuvius", False, None),  # AD 79
+)
+
+
+@lru_cache(maxsize=None)
+def _load_fixture_bytes(filename: str) -> bytes:
+    """Load raw HTML fixture bytes from the fixtures directory."""
+    return (_FIXTURES_DIR / filename).read_bytes()
+
+
+@lru_cache(maxsize=None)
 def _load_fixture(filename: str) -> str:
-    """Load HTML fixture content from the fixtures directory."""
-    fixtures_dir = Path(__file__).parent / "fixtures"
-    return (fixtures_dir / filename).read_text(encoding="utf-8")
+    """Load HTML fixture content, decoded once from the cached bytes.
+    
+    The strategy's html_content is text (as returned by get_html), so the
+    fixture is decoded here rather than handed over as bytes.
+    """
+    return _load_fixture_bytes(filename).decode("utf-8")
 
 
+@lru_cache(maxsize=None)
 def _load_expected_events(filename: str) -> list:
-    """Load expected events fixture from JSON."""
-    fixtures_dir = Path(__file__).parent / "fixtures"
-    with open(fixtures_dir / filename, 'r') as f:
-        return json.load(f)
+    """Load expected events fixture from JSON.
+    
+    The result is cached and shared between tests; callers must not mutate it.
+    """
+    return json.loads((_FIXTURES_DIR / filename).read_bytes())
 
 
+@lru_cache(maxsize=None)
 def _load_schema() -> dict:
-    """Load the import schema."""
-    schema_path = Path(__file__).parent.parent.parent.parent / "import_schema.json"
-    with open(schema_path, 'r') as f:
-        return json.load(f)
+    """Load the import schema (cached; callers must not mutate it).
+    
+    This runs at import time, so a missing schema file fails collection.
+    """
+    return json.loads(_SCHEMA_PATH.read_bytes())
+
+
+_EVENT_SCHEMA = _load_schema()["properties"]["events"]["items"]
+_METADATA_SCHEMA = _load_schema()["properties"]["metadata"]
+
+
+def _build_events_validator() -> jsonschema.protocols.Validator:
+    """Compile a validator for a whole list of events against the event schema.
+    
+    The validator class follows the root schema's declared draft ($schema),
+    which the bare events.items sub-schema does not carry itself. Evolving a
+    root validator keeps its reference resolver, so any $ref in the event
+    schema resolves against the root document built here, once.
+    """
+    schema = _load_schema()
+    events_schema = {"type": "array", "items": _EVENT_SCHEMA}
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(events_schema)
+    return validator_cls(schema).evolve(schema=events_schema)
+
+
+_EVENTS_VALIDATOR = _build_events_validator()
+
+
+def _assert_events_match_schema(event_dicts: list) -> None:
+    """Validate all events in one pass and fail with every error found."""
+    errors = list(_EVENTS_VALIDATOR.iter_errors(event_dicts))
+    if errors:
+        pytest.fail("Event schema validation failed:\n" + "\n".join(
+            f"  {error.json_path}: {error.message}" for error in errors
+        ))
+
+
+def _project(event_dicts: list, keys: tuple, strip_title: bool = False) -> list:
+    """Project event dicts onto tuples of the given keys for bulk comparison."""
+    return [
+        tuple(event[k].strip() if strip_title and k == "title" else event[k] for k in keys)
+        for event in event_dicts
+    ]
+
+
+def _parse_fixture(filename: str, output_dir: Path) -> ArtifactData:
+    """Run parse() and generate_artifacts() on a fixture and return the artifact data."""
+    strategy = TimelineOfRomanHistoryStrategy(
+        run_id=_RUN_ID,
+        output_dir=output_dir
+    )
+    strategy.html_content = _load_fixture(filename)
+    strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
+    
+    fetch_result = FetchResult(
+        strategy_name="timeline_of_roman_history",
+        fetch_count=1,
+        fetch_metadata={"url": strategy.canonical_url}
+    )
+    parse_result = strategy.parse(fetch_result)
+    return strategy.generate_artifacts(parse_result)
+
+
+@pytest.fixture(scope="module")
+def parsed_6th_bc(tmp_path_factory) -> ArtifactData:
+    """Artifact data for the 6th century BC fixture, parsed once per module."""
+    return _parse_fixture('sample_html_6th_century_bc.html', tmp_path_factory.mktemp("phase4_6th_bc"))
+
+
+@pytest.fixture(scope="module")
+def parsed_1st_ad(tmp_path_factory) -> ArtifactData:
+    """Artifact data for the 1st century AD fixture, parsed once per module."""
+    return _parse_fixture('sample_html_1st_century_ad.html', tmp_path_factory.mktemp("phase4_1st_ad"))
+
+
+@pytest.fixture(scope="module")
+def event_dicts_6th_bc(parsed_6th_bc) -> list:
+    """Serialized events for the 6th century BC fixture, built once per module."""
+    return [event.to_dict() for event in parsed_6th_bc.events]
+
+
+@pytest.fixture(scope="module")
+def event_dicts_1st_ad(parsed_1st_ad) -> list:
+    """Serialized events for the 1st century AD fixture, built once per module."""
+    return [event.to_dict() for event in parsed_1st_ad.events]
 
 
 class TestArtifactSchemaValidation:
     """Test that generated artifacts match the import_schema.json schema."""
     
-    def test_schema_file_exists(self):
-        """Verify import_schema.json exists."""
-        schema_path = Path(__file__).parent.parent.parent.parent / "import_schema.json"
-        assert schema_path.exists(), f"Schema file not found at {schema_path}"
-    
-    def test_6th_century_bc_fixture_matches_schema(self):
-        """T095: Parse 6th century BC fixture and validate events against schema."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        # Load fixture
-        html_content = _load_fixture('sample_html_6th_century_bc.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        # Parse
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
-        
-        # Validate event structure against schema
-        schema = _load_schema()
-        event_schema = schema["properties"]["events"]["items"]
+    @pytest.mark.parametrize("parsed_fixture", ["parsed_6th_bc", "parsed_1st_ad"])
+    def test_fixture_matches_schema(self, parsed_fixture, request):
+        """T095: Validate each parsed fixture's artifact and events against schema."""
+        artifact_data = request.getfixturevalue(parsed_fixture)
         
         artifact_dict = artifact_data.to_dict()
         
@@ -73,93 +177,21 @@ class TestArtifactSchemaValidation:
         assert "generated_at_utc" in artifact_dict
         assert artifact_dict["event_count"] == len(artifact_dict["events"])
         
-        # Validate each event against the event schema
-        for event_dict in artifact_dict["events"]:
-            try:
-                jsonschema.validate(instance=event_dict, schema=event_schema)
-            except jsonschema.ValidationError as e:
-                pytest.fail(f"Event validation failed: {e.message}")
-
-    
-    def test_1st_century_ad_fixture_matches_schema(self):
-        """Parse 1st century AD fixture and validate events against schema."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        # Load fixture
-        html_content = _load_fixture('sample_html_1st_century_ad.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        # Parse
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
-        
-        # Validate event structure against schema
-        schema = _load_schema()
-        event_schema = schema["properties"]["events"]["items"]
-        
-        artifact_dict = artifact_data.to_dict()
-        
-        assert artifact_dict["event_count"] == len(artifact_dict["events"])
-        
-        # Validate each event against the event schema
-        for event_dict in artifact_dict["events"]:
-            try:
-                jsonschema.validate(instance=event_dict, schema=event_schema)
-            except jsonschema.ValidationError as e:
-                pytest.fail(f"Event validation failed: {e.message}")
+        _assert_events_match_schema(artifact_dict["events"])
 
     
-    def test_artifact_event_count_matches_expected(self):
+    def test_artifact_event_count_matches_expected(self, parsed_6th_bc):
         """T096: Verify artifact event_count matches expected event count."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        html_content = _load_fixture('sample_html_6th_century_bc.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
+        artifact_data = parsed_6th_bc
         
         # Check event count
         assert artifact_data.event_count == 8
         assert len(artifact_data.events) == 8
         assert artifact_data.to_dict()["event_count"] == 8
     
-    def test_all_events_have_valid_event_keys(self):
+    def test_all_events_have_valid_event_keys(self, parsed_1st_ad):
         """T097: Verify all events have valid event_key values."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        html_content = _load_fixture('sample_html_1st_century_ad.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
+        artifact_data = parsed_1st_ad
         
         # All events should have proper keys
         for event in artifact_data.events:
@@ -169,138 +201,45 @@ class TestArtifactSchemaValidation:
             assert event.title is not None and len(event.title) > 0
             assert event.url is not None and event.url.startswith("http")
     
-    def test_bc_dates_have_correct_flags(self):
+    def test_bc_dates_have_correct_flags(self, parsed_1st_ad):
         """T098: Verify BC dates have is_bc_start=True, AD dates have is_bc_start=False."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        html_content = _load_fixture('sample_html_1st_century_ad.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
+        artifact_data = parsed_1st_ad
         
         # Check specific known events:
         # BC events (should have is_bc_start=True): Caesar (100), Social War (100), Augustus (63), Augustus era (27)
         # AD events (should have is_bc_start=False): Augustus dies (14 AD), Crucifixion (33 AD), Vesuvius (79 AD)
         for event in artifact_data.events:
-            if "Caesar" in event.title:
-                # Gaius Julius Caesar born 100 BC
-                assert event.is_bc_start == True, f"Caesar should be BC"
-            if "Augustus" in event.title:
-                # Various Augustus events, mostly BC or transition
-                # "granted the title" is 27 BC, "celebrates his birthday" is 27 BC, "Death of Augustus" is 14 AD
-                if "Death" in event.title:
-                    assert event.is_bc_start == False, f"Augustus death should be AD 14"
-                else:
-                    assert event.is_bc_start == True, f"Augustus era events should be BC"
-            if "Jesus" in event.title or "Crucifixion" in event.title:
-                # 33 AD
-                assert event.is_bc_start == False, f"Crucifixion should be AD"
-            if "Vesuvius" in event.title:
-                # 79 AD
-                assert event.is_bc_start == False, f"Vesuvius should be AD"
-
-
+            title = event.title
+            for needle, expected_bc, flip in _EXPECTED_BC_BY_TITLE:
+                if needle in title:
+                    if flip is not None and flip in title:
+                        expected_bc = not expected_bc
+                    assert event.is_bc_start == expected_bc, \
+                        f"{needle} event should be {'BC' if expected_bc else 'AD'}: {title}"
     
-    def test_all_events_have_required_fields(self):
+    def test_all_events_have_required_fields(self, event_dicts_6th_bc):
         """T099: Verify all events have required fields per schema."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        html_content = _load_fixture('sample_html_6th_century_bc.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
-        
-        required_fields = [
-            "title", "start_year", "end_year", "is_bc_start", "is_bc_end",
-            "precision", "weight", "url", "span_match_notes", "description", "category"
-        ]
-        
-        for event in artifact_data.events:
-            event_dict = event.to_dict()
-            for field in required_fields:
+        for event_dict in event_dicts_6th_bc:
+            for field in _REQUIRED_FIELDS:
                 assert field in event_dict, f"Event missing required field: {field}"
-                # Field should not be None for required fields
-                if field not in ["start_month", "start_day", "end_month", "end_day", "_debug_extraction"]:
-                    assert event_dict[field] is not None, f"Event required field {field} is None"
+            # Field should not be None for required fields
+            for field in _REQUIRED_NONNULL:
+                assert event_dict[field] is not None, f"Event required field {field} is None"
     
-    def test_schema_validation_with_jsonschema(self):
+    def test_schema_validation_with_jsonschema(self, event_dicts_6th_bc):
         """T099b: Validate event documents match import_schema.json using jsonschema."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        html_content = _load_fixture('sample_html_6th_century_bc.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
-        
-        schema = _load_schema()
-        event_schema = schema["properties"]["events"]["items"]
-        artifact_dict = artifact_data.to_dict()
-        
-        # Validate each event against the event schema
-        for event_dict in artifact_dict["events"]:
-            try:
-                jsonschema.validate(instance=event_dict, schema=event_schema)
-            except jsonschema.ValidationError as e:
-                pytest.fail(f"Event schema validation failed: {e.message}\nEvent: {event_dict}")
+        _assert_events_match_schema(event_dicts_6th_bc)
 
     
-    def test_metadata_structure_complete(self):
+    def test_metadata_structure_complete(self, parsed_6th_bc):
         """Verify metadata matches the schema definition."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
+        artifact_data = parsed_6th_bc
         
-        html_content = _load_fixture('sample_html_6th_century_bc.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
-        
-        artifact_dict = artifact_data.to_dict()
-        metadata = artifact_dict["metadata"]
+        metadata = artifact_data.metadata
         
         # Validate metadata against schema
-        schema = _load_schema()
-        metadata_schema = schema["properties"]["metadata"]
         try:
-            jsonschema.validate(instance=metadata, schema=metadata_schema)
+            jsonschema.validate(instance=metadata, schema=_METADATA_SCHEMA)
         except jsonschema.ValidationError as e:
             pytest.fail(f"Metadata schema validation failed: {e.message}\nMetadata: {metadata}")
 
@@ -309,71 +248,28 @@ class TestArtifactSchemaValidation:
 class TestExpectedEventFixtures:
     """Tests comparing parsed output against expected fixtures."""
     
-    def test_6th_century_bc_matches_expected_events(self):
+    def test_6th_century_bc_matches_expected_events(self, event_dicts_6th_bc):
         """T093: Compare parsed 6th century BC against expected_events_6th_century_bc.json."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        html_content = _load_fixture('sample_html_6th_century_bc.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
-        
         expected_events = _load_expected_events('expected_events_6th_century_bc.json')
-        actual_events = [e.to_dict() for e in artifact_data.events]
+        actual_events = event_dicts_6th_bc
         
         # Event count should match
         assert len(actual_events) == len(expected_events), \
             f"Event count mismatch: expected {len(expected_events)}, got {len(actual_events)}"
         
-        # Check key properties of each event
-        for actual, expected in zip(actual_events, expected_events):
-            assert actual["title"].strip() == expected["title"].strip()
-            assert actual["start_year"] == expected["start_year"]
-            assert actual["end_year"] == expected["end_year"]
-            assert actual["is_bc_start"] == expected["is_bc_start"]
-            assert actual["is_bc_end"] == expected["is_bc_end"]
-            assert actual["description"] == expected["description"]
+        # Check key properties of each event in one comparison
+        assert _project(actual_events, _COMPARE_KEYS, strip_title=True) == \
+            _project(expected_events, _COMPARE_KEYS, strip_title=True)
     
-    def test_1st_century_ad_matches_expected_events(self):
+    def test_1st_century_ad_matches_expected_events(self, event_dicts_1st_ad):
         """T094: Compare parsed 1st century AD against expected_events_1st_century_ad.json."""
-        strategy = TimelineOfRomanHistoryStrategy(
-            run_id=datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            output_dir=Path('/tmp/test_artifacts')
-        )
-        
-        html_content = _load_fixture('sample_html_1st_century_ad.html')
-        strategy.html_content = html_content
-        strategy.canonical_url = "https://en.wikipedia.org/wiki/Timeline_of_Roman_history"
-        
-        fetch_result = FetchResult(
-            strategy_name="timeline_of_roman_history",
-            fetch_count=1,
-            fetch_metadata={"url": strategy.canonical_url}
-        )
-        parse_result = strategy.parse(fetch_result)
-        artifact_data = strategy.generate_artifacts(parse_result)
-        
         expected_events = _load_expected_events('expected_events_1st_century_ad.json')
-        actual_events = [e.to_dict() for e in artifact_data.events]
+        actual_events = event_dicts_1st_ad
         
         # Event count should match
         assert len(actual_events) == len(expected_events), \
             f"Event count mismatch: expected {len(expected_events)}, got {len(actual_events)}"
         
-        # Check key properties
-        for actual, expected in zip(actual_events, expected_events):
-            assert actual["title"] == expected["title"]
-            assert actual["start_year"] == expected["start_year"]
-            assert actual["end_year"] == expected["end_year"]
-            assert actual["is_bc_start"] == expected["is_bc_start"]
-            assert actual["is_bc_end"] == expected["is_bc_end"]
+        # Check key properties (descriptions are not pinned for this fixture)
+        assert _project(actual_events, _DATE_COMPARE_KEYS) == \
+            _project(expected_events, _DATE_COMPARE_KEYS)
@@ -1,20 +1,33 @@
 """Tests for Timeline of Roman History ingestion strategy."""
 
+import time
 import pytest
+from functools import lru_cache
+from importlib import resources
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-from datetime import datetime
+from lxml import html as lxml_html
 
+from ingestion_common import INFO_LOG
 from strategies.timeline_of_roman_history.timeline_of_roman_history_strategy import (
     TimelineOfRomanHistoryStrategy
 )
 from strategies.strategy_base import FetchResult, ParseResult
 
 
-def _load_fixture(filename: str) -> str:
-    """Load HTML fixture content from the fixtures directory."""
-    fixtures_dir = Path(__file__).parent / "fixtures"
-    return (fixtures_dir / filename).read_text(encoding="utf-8")
+# Fixed run_id; tests only need it to be a stable identifier
+_RUN_ID = "19700101T000000Z"
+
+# parse() only reads its FetchResult, so tests can share one
+_FETCH_RESULT = FetchResult(strategy_name="TimelineOfRomanHistory", fetch_count=1)
+
+
+_FIXTURES = resources.files(__package__).joinpath("fixtures")
+
+
+@lru_cache(maxsize=None)
+def _load_fixture_bytes(filename: str) -> bytes:
+    """Load raw HTML fixture bytes from the fixtures directory."""
+    return _FIXTURES.joinpath(filename).read_bytes()
 
 
 # Sample HTML fragments for testing
@@ -132,41 +145,69 @@ SAMPLE_TABLE_BYZANTINE = """
 </html>
 """
 
+# Minimal table: one unparseable row, one too-short row, one valid row
 SAMPLE_MALFORMED_TABLE = """
-<html>
-<body>
 <table class="wikitable">
-<tr>
-<th>Year</th>
-<th>Date</th>
-<th>Event</th>
-</tr>
-<tr>
-<td>Invalid Year</td>
-<td>Invalid Date</td>
-<td>This should be skipped</td>
-</tr>
-<tr>
-<td>509 BC</td>
-</tr>
-<tr>
-<td>264 BC</td>
-<td>January</td>
-<td>Valid event after malformed row</td>
-</tr>
+<tr><th>Year</th><th>Date</th><th>Event</th></tr>
+<tr><td>Invalid Year</td><td>Invalid Date</td><td>This should be skipped</td></tr>
+<tr><td>509 BC</td></tr>
+<tr><td>264 BC</td><td>January</td><td>Valid event after malformed row</td></tr>
 </table>
-</body>
-</html>
 """
 
+# The sample tables parsed once; parse_from_tree() only reads the trees
+_SAMPLE_TREES = {
+    "simple": lxml_html.document_fromstring(SAMPLE_TABLE_HTML),
+    "rowspan": lxml_html.document_fromstring(SAMPLE_TABLE_WITH_ROWSPAN),
+    "bc_to_ad": lxml_html.document_fromstring(SAMPLE_TABLE_BC_TO_AD),
+    "malformed": lxml_html.document_fromstring(SAMPLE_MALFORMED_TABLE),
+}
+
+
+def _check_byzantine(result: ParseResult) -> None:
+    """Byzantine period events span late antiquity to the fall of Constantinople."""
+    years = {event.start_year for event in result.events}
+    assert {330, 395, 527, 532, 1204, 1453}.issubset(years)
+    assert all(event.category == "roman_history" for event in result.events)
+
+
+def _check_legendary(result: ParseResult) -> None:
+    """The 6th century BC fixture covers the legendary period."""
+    assert result.parse_metadata["confidence_distribution"].get("legendary", 0) > 0
+
+
+def _check_bc_to_ad(result: ParseResult) -> None:
+    """The 1st century AD fixture crosses the BC→AD transition."""
+    assert any(event.is_bc_start for event in result.events)
+    assert any(not event.is_bc_start for event in result.events)
+
 
 @pytest.fixture
-def strategy():
-    """Create a strategy instance for testing."""
-    run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    output_dir = Path("/tmp/test_roman_history")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return TimelineOfRomanHistoryStrategy(run_id, output_dir)
+def strategy(tmp_path):
+    """Create a fresh strategy instance for each test."""
+    return TimelineOfRomanHistoryStrategy(_RUN_ID, tmp_path)
+
+
+@pytest.fixture(scope="module")
+def parsed_fixture(tmp_path_factory):
+    """Parse saved article fixtures at most once per module.
+    
+    Returns a function mapping a fixture filename to its ParseResult. Each
+    fixture gets its own strategy, since parse() accumulates events on the
+    instance.
+    """
+    output_dir = tmp_path_factory.mktemp("roman_history_fixtures")
+    parsed = {}
+    
+    def _parsed(filename: str) -> ParseResult:
+        if filename not in parsed:
+            strategy = TimelineOfRomanHistoryStrategy(_RUN_ID, output_dir)
+            strategy.html_content = _load_fixture_bytes(filename)
+            strategy.canonical_url = "https://test.url"
+            parsed[filename] = strategy.parse(_FETCH_RESULT)
+        return parsed[filename]
+    
+    return _parsed
 
 
 class TestStrategyBasics:
@@ -188,13 +229,9 @@ class TestStrategyBasics:
 class TestFetchPhase:
     """Test the fetch phase."""
     
-    @patch('strategies.timeline_of_roman_history.timeline_of_roman_history_strategy.get_html')
     def test_fetch_success(self, mock_get_html, strategy):
         """Test successful fetch returns FetchResult."""
-        mock_get_html.return_value = (
-            ("<html><body>Test content</body></html>", "https://final.url"),
-            None
-        )
+        mock_get_html("<html><body>Test content</body></html>", "https://final.url")
         
         result = strategy.fetch()
         
@@ -206,24 +243,16 @@ class TestFetchPhase:
         assert "url" in result.fetch_metadata
         assert "final_url" in result.fetch_metadata
     
-    @patch('strategies.timeline_of_roman_history.timeline_of_roman_history_strategy.get_html')
     def test_fetch_failure(self, mock_get_html, strategy):
         """Test fetch failure raises RuntimeError."""
-        mock_get_html.return_value = (
-            ("", "https://url"),
-            "Connection timeout"
-        )
+        mock_get_html("", "https://url", "Connection timeout")
         
         with pytest.raises(RuntimeError, match="Failed to fetch article"):
             strategy.fetch()
     
-    @patch('strategies.timeline_of_roman_history.timeline_of_roman_history_strategy.get_html')
     def test_fetch_empty_content(self, mock_get_html, strategy):
         """Test fetch with empty content raises RuntimeError."""
-        mock_get_html.return_value = (
-            ("   ", "https://url"),
-            None
-        )
+        mock_get_html("   ", "https://url")
         
         with pytest.raises(RuntimeError, match="Failed to fetch article"):
             strategy.fetch()
@@ -234,25 +263,14 @@ class TestParsePhase:
     
     def test_parse_without_fetch_raises_error(self, strategy):
         """Test parsing without fetch raises RuntimeError."""
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
         with pytest.raises(RuntimeError, match="No HTML content available"):
-            strategy.parse(fetch_result)
+            strategy.parse(_FETCH_RESULT)
     
     def test_parse_simple_table(self, strategy):
         """Test parsing a simple table with BC dates."""
-        strategy.html_content = SAMPLE_TABLE_HTML
         strategy.canonical_url = "https://test.url"
         
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
-        result = strategy.parse(fetch_result)
+        result = strategy.parse_from_tree(_SAMPLE_TREES["simple"])
         
         assert isinstance(result, ParseResult)
         assert result.strategy_name == "TimelineOfRomanHistory"
@@ -274,15 +292,9 @@ class TestParsePhase:
     
     def test_parse_table_with_rowspan(self, strategy):
         """Test parsing table with rowspan inheritance."""
-        strategy.html_content = SAMPLE_TABLE_WITH_ROWSPAN
         strategy.canonical_url = "https://test.url"
         
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
-        result = strategy.parse(fetch_result)
+        result = strategy.parse_from_tree(_SAMPLE_TREES["rowspan"])
         
         assert len(result.events) == 4
         
@@ -304,15 +316,9 @@ class TestParsePhase:
     
     def test_parse_bc_to_ad_transition(self, strategy):
         """Test parsing BC to AD transition."""
-        strategy.html_content = SAMPLE_TABLE_BC_TO_AD
         strategy.canonical_url = "https://test.url"
         
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
-        result = strategy.parse(fetch_result)
+        result = strategy.parse_from_tree(_SAMPLE_TREES["bc_to_ad"])
         
         assert len(result.events) == 3
         
@@ -330,81 +336,36 @@ class TestParsePhase:
         assert result.events[2].start_month == 8
         assert result.events[2].start_day == 19
     
-    def test_parse_byzantine_period(self, strategy):
-        """Test parsing Byzantine period events."""
-        strategy.html_content = _load_fixture("sample_html_byzantine.html")
-        strategy.canonical_url = "https://test.url"
-        
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
-        result = strategy.parse(fetch_result)
-        
-        assert len(result.events) == 8
-        
-        years = {event.start_year for event in result.events}
-        assert {330, 395, 527, 532, 1204, 1453}.issubset(years)
-        assert all(event.category == "roman_history" for event in result.events)
-
-    def test_parse_fixture_6th_century_bc(self, strategy):
-        """Parse fixture with legendary period and rowspan inheritance."""
-        strategy.html_content = _load_fixture("sample_html_6th_century_bc.html")
-        strategy.canonical_url = "https://test.url"
-
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-
-        result = strategy.parse(fetch_result)
-
-        assert len(result.events) == 8
-        assert result.parse_metadata["confidence_distribution"].get("legendary", 0) > 0
-
-    def test_parse_fixture_1st_century_ad(self, strategy):
-        """Parse fixture with BC→AD transition and rowspans."""
-        strategy.html_content = _load_fixture("sample_html_1st_century_ad.html")
-        strategy.canonical_url = "https://test.url"
-
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-
-        result = strategy.parse(fetch_result)
-
-        assert len(result.events) == 10
-        assert any(event.is_bc_start for event in result.events)
-        assert any(not event.is_bc_start for event in result.events)
-
-    @patch("strategies.timeline_of_roman_history.timeline_of_roman_history_strategy.log_info")
-    def test_parse_logs_inherited_rows(self, mock_log_info, strategy):
-        """Rows inheriting from rowspan should log a message."""
-        strategy.html_content = _load_fixture("sample_html_6th_century_bc.html")
+    @pytest.mark.parametrize(
+        "fixture_name,expected_events,check",
+        [
+            ("sample_html_byzantine.html", 8, _check_byzantine),
+            ("sample_html_6th_century_bc.html", 8, _check_legendary),
+            ("sample_html_1st_century_ad.html", 10, _check_bc_to_ad),
+        ],
+        ids=["byzantine", "6th_century_bc", "1st_century_ad"],
+    )
+    def test_parse_fixture(self, parsed_fixture, fixture_name, expected_events, check):
+        """Parse a saved article fixture and check its period-specific properties."""
+        result = parsed_fixture(fixture_name)
+
+        assert len(result.events) == expected_events
+        check(result)
+
+    def test_parse_logs_inherited_rows(self, strategy):
+        """Rows inheriting from rowspan should be logged to the run's info log."""
         strategy.canonical_url = "https://test.url"
+        strategy.parse_from_tree(_SAMPLE_TREES["rowspan"])
 
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-
-        strategy.parse(fetch_result)
-
-        assert any("Inherited year" in call.args[0] for call in mock_log_info.call_args_list)
+        (handler,) = INFO_LOG.handlers
+        handler.flush()
+        assert "Inherited year" in Path(handler.baseFilename).read_text(encoding="utf-8")
     
     def test_parse_malformed_table(self, strategy):
         """Test parsing table with malformed rows."""
-        strategy.html_content = SAMPLE_MALFORMED_TABLE
         strategy.canonical_url = "https://test.url"
         
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
-        result = strategy.parse(fetch_result)
+        result = strategy.parse_from_tree(_SAMPLE_TREES["malformed"])
         
         # Should extract one valid event, skip malformed rows
         assert len(result.events) == 1
@@ -417,15 +378,9 @@ class TestParsePhase:
     
     def test_parse_metadata_structure(self, strategy):
         """Test parse result includes proper metadata."""
-        strategy.html_content = SAMPLE_TABLE_HTML
         strategy.canonical_url = "https://test.url"
         
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
-        result = strategy.parse(fetch_result)
+        result = strategy.parse_from_tree(_SAMPLE_TREES["simple"])
         
         # Check metadata structure
         assert "elapsed_seconds" in result.parse_metadata
@@ -439,6 +394,23 @@ class TestParsePhase:
         assert result.parse_metadata["total_tables"] == 1
         assert result.parse_metadata["events_extracted"] == len(result.events)
 
+    def test_parse_elapsed_includes_tree_building(self, strategy, monkeypatch):
+        """parse() times building the tree as well as table extraction."""
+        module = "strategies.timeline_of_roman_history.timeline_of_roman_history_strategy"
+        make_tree = lxml_html.document_fromstring
+
+        def slow_make_tree(content):
+            time.sleep(0.05)
+            return make_tree(content)
+
+        monkeypatch.setattr(f"{module}._make_tree", slow_make_tree)
+        strategy.html_content = SAMPLE_TABLE_HTML
+        strategy.canonical_url = "https://test.url"
+
+        result = strategy.parse(_FETCH_RESULT)
+
+        assert result.parse_metadata["elapsed_seconds"] >= 0.05
+
 
 class TestArtifactGeneration:
     """Test artifact generation phase."""
@@ -513,13 +485,9 @@ class TestArtifactGeneration:
 class TestIntegration:
     """Integration tests for the full workflow."""
     
-    @patch('strategies.timeline_of_roman_history.timeline_of_roman_history_strategy.get_html')
     def test_full_workflow_fetch_parse_generate(self, mock_get_html, strategy):
         """Test complete workflow: fetch → parse → generate."""
-        mock_get_html.return_value = (
-            (SAMPLE_TABLE_HTML, "https://final.url"),
-            None
-        )
+        mock_get_html(SAMPLE_TABLE_HTML)
         
         # Fetch
         fetch_result = strategy.fetch()
@@ -539,13 +507,9 @@ class TestIntegration:
             assert hasattr(event, 'is_bc_start')
             assert hasattr(event, 'title')
     
-    @patch('strategies.timeline_of_roman_history.timeline_of_roman_history_strategy.get_html')
     def test_confidence_distribution(self, mock_get_html, strategy):
         """Test that confidence distribution is calculated."""
-        mock_get_html.return_value = (
-            (SAMPLE_TABLE_WITH_ROWSPAN, "https://final.url"),
-            None
-        )
+        mock_get_html(SAMPLE_TABLE_WITH_ROWSPAN)
         
         fetch_result = strategy.fetch()
         parse_result = strategy.parse(fetch_result)
@@ -567,18 +531,17 @@ class TestErrorHandling:
         ]
         
         # Should not raise exception
-        strategy.cleanup_logs()
+        errors_file = strategy.cleanup_logs()
         
         # Check error file was created
-        error_files = list(strategy.output_dir.glob("parse_errors_*.json"))
-        assert len(error_files) > 0
+        assert errors_file is not None and errors_file.exists()
     
     def test_cleanup_logs_without_errors(self, strategy):
         """Test cleanup logs works with no errors."""
         strategy.parse_errors = []
         
-        # Should not raise exception
-        strategy.cleanup_logs()
+        # Should not raise exception; nothing to write
+        assert strategy.cleanup_logs() is None
 
 
 class TestEventConversion:
@@ -586,15 +549,9 @@ class TestEventConversion:
     
     def test_roman_event_to_historical_event_conversion(self, strategy):
         """Test that RomanEvents are properly converted to HistoricalEvents."""
-        strategy.html_content = SAMPLE_TABLE_HTML
         strategy.canonical_url = "https://test.url"
         
-        fetch_result = FetchResult(
-            strategy_name="TimelineOfRomanHistory",
-            fetch_count=1
-        )
-        
-        result = strategy.parse(fetch_result)
+        result = strategy.parse_from_tree(_SAMPLE_TREES["simple"])
         
         # All events should be HistoricalEvent instances
         for event in result.events:
@@ -5,23 +5,100 @@ from the Wikipedia "Timeline of Roman History" article. The article uses tables
 year and date columns that require special rowspan handling.
 """
 
-import re
-from datetime import datetime
+import json
+import time
+from collections import Counter
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml import html as lxml_html
 
-from ingestion_common import get_html, log_info, log_error
+from ingestion_common import INFO_LOG, get_html, log_info, log_error
 from strategies.strategy_base import (
     IngestionStrategy,
     FetchResult,
     ParseResult,
     ArtifactData,
+    normalize_confidence_distribution,
 )
 from span_parsing.table_row_date_parser import TableRowDateParser, RowspanContext
 from span_parsing.roman_event import RomanEvent
 
 
+# libxml2 assumes Latin-1 for bytes without a charset declaration
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+# Event tables, including multi-class ones like "wikitable sortable"
+_WIKITABLE_XPATH = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]"
+)
+
+# Visible text of a cell; like bs4's get_text(), skips style/script/template content
+_CELL_TEXT_XPATH = etree.XPath(
+    './/text()[not(ancestor::style or ancestor::script or ancestor::template)]'
+)
+
+# Per-row diagnostics go to the run's info log but not stdout; a child of
+# INFO_LOG uses its file handler and level, and formats lazily
+logger = INFO_LOG.getChild("timeline_of_roman_history")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a trailing 'Z'."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _make_tree(markup: str | bytes) -> lxml_html.HtmlElement:
+    """Parse article HTML into an lxml document tree.
+    
+    Bytes are decoded as UTF-8 by libxml2 itself, without a Python-level
+    decode.
+    """
+    parser = _UTF8_HTML_PARSER if isinstance(markup, bytes) else None
+    try:
+        return lxml_html.document_fromstring(markup, parser=parser)
+    except etree.ParserError:
+        # Whitespace-only content: treat it as a page with no tables
+        return lxml_html.document_fromstring('<html></html>')
+
+
+# Row shapes in an event table, see _row_shape
+_ROW_TOO_SHORT = 0   # Fewer than two cells and nothing to inherit
+_ROW_INHERITED = 1   # Year comes from an earlier row's rowspan; cells[0] is the date
+_ROW_NORMAL = 2      # Year, date and event cells
+
+
+def _row_shape(cells: list, rowspan_context: RowspanContext) -> int:
+    """Classify a data row (at least one cell) by where its year comes from."""
+    if rowspan_context.should_inherit() and (len(cells) < 3 or cells[0].tag != 'td'):
+        return _ROW_INHERITED
+    if len(cells) < 2:
+        return _ROW_TOO_SHORT
+    return _ROW_NORMAL
+
+
+def _inherited_row_texts(
+    cell_texts: list[str], rowspan_context: RowspanContext
+) -> tuple[str, str, str]:
+    """Year, date and event text for a row continuing a year rowspan."""
+    year_text = str(rowspan_context.inherited_year)
+    if rowspan_context.inherited_is_bc:
+        year_text = f"{rowspan_context.inherited_year} BC"
+    return year_text, cell_texts[0], " ".join(cell_texts[1:]).strip()
+
+
+def _normal_row_texts(
+    cell_texts: list[str], rowspan_context: RowspanContext
+) -> tuple[str, str, str]:
+    """Year, date and event text for a row with its own year cell."""
+    return cell_texts[0], cell_texts[1], " ".join(cell_texts[2:]).strip()
+
+
+# Text extraction per row shape, indexed by the _ROW_* codes
+_ROW_TEXT_HANDLERS = (None, _inherited_row_texts, _normal_row_texts)
+
+
 class TimelineOfRomanHistoryStrategy(IngestionStrategy):
     """Ingestion strategy for Wikipedia Timeline of Roman History article.
     
@@ -47,31 +124,30 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
         self.date_parser = TableRowDateParser()
         
         # Storage for parsed data
-        self.html_content: Optional[str] = None
+        # Page HTML; fetch() stores text, callers may also supply raw UTF-8 bytes
+        self.html_content: Optional[str | bytes] = None
         self.canonical_url: Optional[str] = None
         self.roman_events: list[RomanEvent] = []
         self.parse_errors: list[dict] = []
         self.skipped_rows: int = 0
     
     @staticmethod
-    def _extract_text(element: Tag) -> str:
-        """Extract text from a BeautifulSoup element with proper spacing.
+    def _extract_text(element: lxml_html.HtmlElement) -> str:
+        """Extract text from an lxml element with proper spacing.
         
-        Uses get_text(separator=' ') to ensure spaces are added between
-        nested HTML elements (e.g., <br/>, <b>, <i>), preventing text
-        from being concatenated without spaces.
+        Joins the element's text nodes with spaces so text from nested
+        HTML elements (e.g., <br/>, <b>, <i>) is not concatenated
+        without spaces.
         
         Args:
-            element: BeautifulSoup Tag to extract text from
+            element: lxml element to extract text from
         
         Returns:
             Normalized text with proper spacing between elements
         """
-        # Use separator to add spaces between text nodes, then normalize multiple spaces
-        text = element.get_text(separator=' ', strip=True)
-        # Collapse multiple whitespace into single spaces
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        # Join text nodes with a separator, then collapse whitespace runs and
+        # trim the ends; str.split() uses the same Unicode whitespace as \s
+        return ' '.join(' '.join(_CELL_TEXT_XPATH(element)).split())
     
     def name(self) -> str:
         """Return the strategy name for logging and artifact naming."""
@@ -110,7 +186,7 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
                 "url": self.WIKIPEDIA_URL,
                 "final_url": final_url,
                 "content_length_bytes": len(self.html_content),
-                "fetch_timestamp_utc": datetime.utcnow().isoformat() + "Z",
+                "fetch_timestamp_utc": _utc_timestamp(),
             }
         )
     
@@ -132,12 +208,45 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
             raise RuntimeError("No HTML content available. Call fetch() first.")
         
         log_info("Parsing Timeline of Roman History article")
-        parse_start = datetime.utcnow()
+        parse_start_utc = _utc_timestamp()
+        parse_start = time.perf_counter()
+        
+        # Building the tree is part of the parse time reported in the metadata;
+        # bytes go to lxml directly, skipping the Python-level decode
+        tree = _make_tree(self.html_content)
+        return self.parse_from_tree(
+            tree, parse_start=parse_start, parse_start_utc=parse_start_utc
+        )
+    
+    def parse_from_tree(
+        self,
+        tree: lxml_html.HtmlElement,
+        parse_start: Optional[float] = None,
+        parse_start_utc: Optional[str] = None,
+    ) -> ParseResult:
+        """Extract events from an already-parsed article.
+        
+        Lets callers that already hold the document tree skip re-parsing
+        the HTML. The tree is only read, never modified. Elapsed time in
+        the metadata runs from parse_start, so parse() passes the time it
+        started building the tree; by default only table extraction is timed.
+        
+        Args:
+            tree: lxml document tree of the Wikipedia article
+            parse_start: time.perf_counter() value the elapsed time is measured from
+            parse_start_utc: ISO timestamp recorded as parsing_start_utc
         
-        soup = BeautifulSoup(self.html_content, 'html.parser')
+        Returns:
+            ParseResult with extracted events and metadata
+        """
+        if parse_start_utc is None:
+            parse_start_utc = _utc_timestamp()
+        # Monotonic clock for the elapsed time; wall-clock stamps are for the metadata
+        if parse_start is None:
+            parse_start = time.perf_counter()
         
         # Find all tables in the article
-        tables = soup.find_all('table', class_='wikitable')
+        tables = _WIKITABLE_XPATH(tree)
         log_info(f"Found {len(tables)} tables to parse")
         
         total_rows_processed = 0
@@ -147,16 +256,14 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
             rows_in_table = self._parse_table(table, table_idx)
             total_rows_processed += rows_in_table
         
-        parse_end = datetime.utcnow()
-        elapsed = (parse_end - parse_start).total_seconds()
+        elapsed = time.perf_counter() - parse_start
+        parse_end_utc = _utc_timestamp()
         
-        # Convert RomanEvents to HistoricalEvents
+        # Convert RomanEvents to HistoricalEvents; span_match_notes falls back
+        # to each event's original_text
+        url = self.canonical_url or self.WIKIPEDIA_URL
         historical_events = [
-            event.to_historical_event(
-                url=self.canonical_url or self.WIKIPEDIA_URL,
-                span_match_notes=event.original_text or ""
-            )
-            for event in self.roman_events
+            event.to_historical_event(url=url) for event in self.roman_events
         ]
         
         # Calculate confidence distribution
@@ -177,8 +284,8 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
                 "sections_identified": len(tables),
                 "total_tables": len(tables),
                 "total_rows_processed": total_rows_processed,
-                "parsing_start_utc": parse_start.isoformat() + "Z",
-                "parsing_end_utc": parse_end.isoformat() + "Z",
+                "parsing_start_utc": parse_start_utc,
+                "parsing_end_utc": parse_end_utc,
                 "elapsed_seconds": elapsed,
                 "events_per_second": len(historical_events) / elapsed if elapsed > 0 else 0,
                 "confidence_distribution": confidence_dist,
@@ -191,17 +298,17 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
             }
         )
     
-    def _parse_table(self, table: Tag, table_idx: int) -> int:
+    def _parse_table(self, table: lxml_html.HtmlElement, table_idx: int) -> int:
         """Parse a single table to extract events.
         
         Args:
-            table: BeautifulSoup table element
+            table: lxml table element
             table_idx: Index of the table for logging
         
         Returns:
             Number of rows processed
         """
-        rows = table.find_all('tr')
+        rows = table.iter('tr')
         # Initialize rowspan context with no inheritance initially
         rowspan_context = RowspanContext(
             inherited_year=0,
@@ -209,82 +316,80 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
             remaining_rows=0,
             source_row_index=-1
         )
-        rows_processed = 0
+        # Events from this table, added to self.roman_events in one extend
+        table_events: list[RomanEvent] = []
+        
+        # Bind per-row callees once instead of resolving them on every row
+        extract_text = self._extract_text
+        parse_row_pair = self.date_parser.parse_row_pair
+        append_event = table_events.append
+        append_error = self.parse_errors.append
         
         for row_idx, row in enumerate(rows):
-            cells = row.find_all(['td', 'th'])
-            
-            # Skip header rows
-            if not cells or all(cell.name == 'th' for cell in cells):
+            # Skip header rows (no td child) before collecting any cells
+            if row.find('td') is None:
                 continue
             
-            # Determine if we need to handle rowspan inheritance
-            # Check if first cell is actually present or inherited via rowspan
-            has_year_cell = len(cells) >= 1 and cells[0].name == 'td'
+            # Cells are direct children of the row; don't walk into cell content
+            cells = [cell for cell in row if cell.tag in ('td', 'th')]
             
-            # If we're inheriting from a rowspan and there's no year cell, the date is in cells[0]
-            if rowspan_context.should_inherit() and (len(cells) < 3 or not has_year_cell):
-                # This row is part of a rowspan - use inherited year
-                year_text = str(rowspan_context.inherited_year)
-                if rowspan_context.inherited_is_bc:
-                    year_text = f"{rowspan_context.inherited_year} BC"
-                date_text = self._extract_text(cells[0]) if len(cells) > 0 else ""
-                event_text = " ".join(
-                    self._extract_text(cell) for cell in cells[1:]
-                ).strip()
-                log_info(
-                    f"Inherited year {year_text} for row {row_idx} in table {table_idx}"
-                )
-                rowspan_context.consume_row()
-            elif len(cells) < 2:
-                log_info(
-                    f"Skipping row {row_idx} in table {table_idx}: "
-                    f"only {len(cells)} columns"
+            shape = _row_shape(cells, rowspan_context)
+            if shape == _ROW_TOO_SHORT:
+                logger.info(
+                    "Skipping row %d in table %d: only %d columns",
+                    row_idx, table_idx, len(cells),
                 )
                 self.skipped_rows += 1
                 continue
-            else:
-                # Normal row with year and date cells
-                year_text = self._extract_text(cells[0])
-                date_text = self._extract_text(cells[1]) if len(cells) > 1 else ""
-                event_text = " ".join(
-                    self._extract_text(cell) for cell in cells[2:]
-                ).strip()
-                
-                # Check if year cell has rowspan attribute
-                if cells[0].get('rowspan'):
-                    try:
-                        rowspan_count = int(cells[0].get('rowspan'))
-                        # Parse the year to get the actual value
-                        temp_parsed = self.date_parser.parse_year_cell(year_text)
-                        # Update rowspan context for subsequent rows
-                        rowspan_context = RowspanContext(
-                            inherited_year=abs(temp_parsed.year),
-                            inherited_is_bc=temp_parsed.is_bc,
-                            remaining_rows=rowspan_count - 1,  # -1 because current row is included in count
-                            source_row_index=row_idx
-                        )
-                    except (ValueError, TypeError) as e:
-                        log_error(f"Invalid rowspan value: {e}")
+            
+            # Extract each cell's text once; the shape handler only slices it
+            cell_texts = [extract_text(cell) for cell in cells]
+            year_text, date_text, event_text = _ROW_TEXT_HANDLERS[shape](
+                cell_texts, rowspan_context
+            )
+            
+            if shape == _ROW_INHERITED:
+                logger.info(
+                    "Inherited year %s for row %d in table %d",
+                    year_text, row_idx, table_idx,
+                )
+                rowspan_context.consume_row()
+            elif cells[0].get('rowspan'):
+                # Year cell starts a rowspan covering the following rows
+                try:
+                    rowspan_count = int(cells[0].get('rowspan'))
+                    # Parse the year to get the actual value
+                    temp_parsed = self.date_parser.parse_year_cell(year_text)
+                    # Update rowspan context for subsequent rows
+                    rowspan_context.reset(
+                        inherited_year=abs(temp_parsed.year),
+                        inherited_is_bc=temp_parsed.is_bc,
+                        remaining_rows=rowspan_count - 1,  # -1 because current row is included in count
+                        source_row_index=row_idx
+                    )
+                except (ValueError, TypeError) as e:
+                    log_error(f"Invalid rowspan value: {e}")
             
             try:
                 # Parse the row using TableRowDateParser
-                parsed_date = self.date_parser.parse_row_pair(
+                parsed_date = parse_row_pair(
                     year_text=year_text,
                     date_text=date_text,
                 )
                 
                 if not event_text:
-                    log_info(
-                        f"Skipping row {row_idx} in table {table_idx}: "
-                        "no event description"
+                    logger.info(
+                        "Skipping row %d in table %d: no event description",
+                        row_idx, table_idx,
                     )
                     self.skipped_rows += 1
                     continue
                 
-                # Create RomanEvent
+                # Create RomanEvent; title, description and original_text share
+                # one string unless the title has to be truncated
+                title = event_text if len(event_text) <= 100 else event_text[:100]
                 roman_event = RomanEvent(
-                    title=event_text[:100],  # Truncate title
+                    title=title,
                     description=event_text,
                     year=parsed_date.year,
                     is_bc=parsed_date.is_bc,
@@ -296,13 +401,12 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
                     category=None,  # Will be enriched later if needed
                 )
                 
-                self.roman_events.append(roman_event)
-                rows_processed += 1
+                append_event(roman_event)
                 
             except Exception as e:
                 error_msg = f"Error parsing row {row_idx} in table {table_idx}: {str(e)}"
                 log_error(error_msg)
-                self.parse_errors.append({
+                append_error({
                     "table_idx": table_idx,
                     "row_idx": row_idx,
                     "error": str(e),
@@ -311,7 +415,8 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
                 self.skipped_rows += 1
                 continue
         
-        return rows_processed
+        self.roman_events.extend(table_events)
+        return len(table_events)
     
     def _calculate_confidence_distribution(self) -> dict:
         """Calculate distribution of confidence levels across events.
@@ -319,9 +424,6 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
         Returns:
             Dictionary with confidence level counts matching schema requirements
         """
-        from collections import Counter
-        from strategies.strategy_base import normalize_confidence_distribution
-        
         confidence_counts = Counter(event.confidence.value for event in self.roman_events)
         
         # Schema requires these specific keys
@@ -348,7 +450,7 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
         artifact_data = ArtifactData(
             strategy_name=self.STRATEGY_NAME,
             run_id=self.run_id,
-            generated_at_utc=datetime.utcnow().isoformat() + "Z",
+            generated_at_utc=_utc_timestamp(),
             event_count=len(parse_result.events),
             events=parse_result.events,
             metadata=parse_result.parse_metadata,
@@ -358,22 +460,31 @@ class TimelineOfRomanHistoryStrategy(IngestionStrategy):
         log_info(f"Generated artifact with {artifact_data.event_count} events")
         return artifact_data
     
-    def cleanup_logs(self) -> None:
+    def cleanup_logs(self) -> Optional[Path]:
         """Generate strategy-specific log files.
         
         Creates additional diagnostic logs for debugging and analysis.
+        
+        Returns:
+            Path of the parse errors file, or None if there were no errors
         """
         log_info(f"[{self.name()}] Cleanup complete")
         
         # Write parse errors log if there were any errors
         if self.parse_errors:
             errors_file = self.output_dir / f"parse_errors_{self.run_id}.json"
-            import json
-            with open(errors_file, 'w') as f:
-                json.dump({
+            # Serialize in one call and write once; json.dump with indent
+            # issues a separate write for every token
+            errors_file.write_text(
+                json.dumps({
                     "strategy": self.STRATEGY_NAME,
                     "run_id": self.run_id,
                     "total_errors": len(self.parse_errors),
                     "errors": self.parse_errors
-                }, f, indent=2)
+                }, indent=2),
+                encoding="utf-8",
+            )
             log_info(f"Wrote parse errors to {errors_file}")
+            return errors_file
+        
+        return None
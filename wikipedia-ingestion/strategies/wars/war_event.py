@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class WarEvent:
     """Structured war event extracted from table row."""
     start_year: int
@@ -1,5 +1,6 @@
 """Factory for creating war row parsing strategies."""
 
+from itertools import product
 from typing import Optional
 
 from .war_row_parsing_strategies import (
@@ -12,16 +13,21 @@ from .war_row_parsing_strategies import (
     TwoDateColumnsStrategy,
     TwoDigitSingleDateSeparateColumnsStrategy,
     TwoDigitTwoDateColumnsStrategy,
+    SIGNATURE_FEATURES,
     WarRowParserStrategy,
+    row_signature,
 )
 
+# Most (cell-count bucket, first cell, second cell) keys remembered per factory
+_PARSER_CACHE_SIZE = 4096
+
 
 class WarRowParserFactory:
     """Factory for selecting the appropriate war row parsing strategy."""
 
     def __init__(self):
         """Initialize with available strategies."""
-        self.strategies = [
+        self.strategies = (
             ParentheticalBetweenRangeStrategy(),
             MergedDateCellsStrategy(),
             SingleDateSeparateColumnsStrategy(),
@@ -31,7 +37,32 @@ class WarRowParserFactory:
             TwoDigitTwoDateColumnsStrategy(),
             Post1000ADTwoDateColumnsStrategy(),
             OneDigitTwoDateColumnsStrategy(),
-        ]
+        )
+        # Rows with at least this many cells all share one cell-count bucket
+        self._max_min_cells = max(strategy.min_cells for strategy in self.strategies)
+        self._candidates = self._build_candidate_table()
+        # can_parse only reads the row length and its first two cells, so
+        # those fully determine which parser a row gets
+        self._parser_cache: dict[tuple[int, str, str], Optional[WarRowParserStrategy]] = {}
+
+    def _build_candidate_table(
+        self,
+    ) -> dict[tuple[int, tuple[bool, ...]], tuple[WarRowParserStrategy, ...]]:
+        """Map every (cell-count bucket, row signature) pair to the strategies that could accept it.
+
+        Candidates keep their order from self.strategies, so the first one whose
+        can_parse succeeds is the same strategy a full linear scan would pick.
+        """
+        table = {}
+        for cell_count in range(self._max_min_cells + 1):
+            for signature in product((False, True), repeat=len(SIGNATURE_FEATURES)):
+                present = {name for name, flag in zip(SIGNATURE_FEATURES, signature) if flag}
+                table[cell_count, signature] = tuple(
+                    strategy for strategy in self.strategies
+                    if strategy.min_cells <= cell_count
+                    and strategy.signature_features <= present
+                )
+        return table
 
     def get_parser(self, cell_texts: list[str]) -> Optional[WarRowParserStrategy]:
         """Get the appropriate parser for the given row structure.
@@ -42,7 +73,24 @@ class WarRowParserFactory:
         Returns:
             The strategy that can parse this row, or None if no strategy matches
         """
-        for strategy in self.strategies:
+        cell_count = min(len(cell_texts), self._max_min_cells)
+        key = (
+            cell_count,
+            cell_texts[0] if cell_texts else "",
+            cell_texts[1] if len(cell_texts) > 1 else "",
+        )
+        try:
+            return self._parser_cache[key]
+        except KeyError:
+            pass
+
+        parser = None
+        for strategy in self._candidates[cell_count, row_signature(cell_texts)]:
             if strategy.can_parse(cell_texts):
-                return strategy
-        return None
\ No newline at end of file
+                parser = strategy
+                break
+
+        if len(self._parser_cache) >= _PARSER_CACHE_SIZE:
+            self._parser_cache.clear()
+        self._parser_cache[key] = parser
+        return parser
\ No newline at end of file
@@ -9,13 +9,73 @@ from typing import Optional
 from strategies.wars.war_event import WarEvent
 
 
+# Cheap first-cell features that can_parse implementations depend on, in the
+# order row_signature reports them.
+SIGNATURE_FEATURES = ('digit', 'era', 'dash', 'century', 'between')
+
+_DIGIT_RE = re.compile(r'\d')
+
+_CITATION_RE = re.compile(r'\[\d+\]')
+_BC_RE = re.compile(r'\s*bc\s*', re.IGNORECASE)
+_AD_RE = re.compile(r'\s*ad\s*', re.IGNORECASE)
+_YEAR_RANGE_RE = re.compile(r'(\d{1,4})\s*[-–]\s*(\d{1,4})')
+_YEAR_3_4_RE = re.compile(r'\d{3,4}')
+_DIGITS_RE = re.compile(r'\d+')
+_CENTURY_RE = re.compile(
+    r'(Early|Mid|Late)?\s*(\d{1,2})(st|nd|rd|th)?\s*century\s*(BC|AD)?', re.IGNORECASE
+)
+_BETWEEN_RE = re.compile(
+    r'\(Between\s+(\d{1,4})\s+and\s+(\d{1,4})\s*(BC|AD)?\)', re.IGNORECASE
+)
+
+# Cell values meaning "no end year yet"; all seven characters long
+_NO_YEAR_SENTINELS = frozenset({'ongoing', 'present', 'current'})
+_NO_YEAR_SENTINEL_LEN = 7
+
+# Belligerent separators, tried in order; the first one that splits the text wins
+_BELLIGERENT_SEPARATORS = (r'\s+vs\.?\s+', r'\s+v\.?\s+', r'\s+versus\s+', r'\s*;\s*', r'\s*,\s*')
+_BELLIGERENT_SEPARATOR_RES = tuple(
+    re.compile(sep, re.IGNORECASE) for sep in _BELLIGERENT_SEPARATORS
+)
+# Matches wherever any one of the separators would
+_ANY_BELLIGERENT_SEPARATOR_RE = re.compile('|'.join(_BELLIGERENT_SEPARATORS), re.IGNORECASE)
+
+
+def row_signature(cell_texts: list[str]) -> tuple[bool, ...]:
+    """Compute the first-cell feature flags for a row, one per SIGNATURE_FEATURES entry.
+
+    The flags are substring checks only; they tell the factory which
+    strategies *could* accept the row, not which one will.
+    """
+    first_cell = cell_texts[0] if cell_texts else ""
+    lowered = first_cell.lower()
+    return (
+        _DIGIT_RE.search(first_cell) is not None,
+        'BC' in first_cell or 'AD' in first_cell or 'c.' in first_cell,
+        '-' in first_cell or '–' in first_cell,
+        'century' in lowered,
+        '(' in first_cell and 'between' in lowered,
+    )
+
+
 class WarRowParserStrategy(ABC):
     """Abstract base class for war table row parsing strategies."""
 
+    # Features from SIGNATURE_FEATURES that must all be present in a row's
+    # first cell for can_parse to return True. Strategies that leave this
+    # empty are considered for every row.
+    signature_features: frozenset[str] = frozenset()
+
+    # Fewest cells a row needs for can_parse to return True
+    min_cells: int = 0
+
     @abstractmethod
     def can_parse(self, cell_texts: list[str]) -> bool:
         """Determine if this strategy can parse the given row.
 
+        The answer must depend only on the number of cells and the text of
+        the first two; WarRowParserFactory caches its choice on exactly that.
+
         Args:
             cell_texts: The text content of each cell in the row
 
@@ -38,19 +98,65 @@ class WarRowParserStrategy(ABC):
         """
         pass
 
+    def _build_event(
+        self,
+        cell_texts: list[str],
+        name_idx: int,
+        start_year: int,
+        end_year: int | None,
+        source_url: str,
+        source_title: str,
+    ) -> WarEvent:
+        """Build a WarEvent from a row's name, belligerents and notes columns.
+
+        The war name is at name_idx, belligerents in the next cell and any
+        remaining cells are joined into notes. A missing end year means the
+        war started and ended in start_year.
+        """
+        n_cells = len(cell_texts)
+        war_name = self._clean_war_name(cell_texts[name_idx]) if n_cells > name_idx else ""
+        belligerents_start_idx = name_idx + 1
+
+        # Extract belligerents
+        belligerents = []
+        if n_cells > belligerents_start_idx:
+            belligerents = self._parse_belligerents(cell_texts[belligerents_start_idx])
+
+        # Extract notes (remaining columns); a single notes column needs no join
+        notes_idx = belligerents_start_idx + 1
+        if n_cells <= notes_idx:
+            notes = ""
+        elif n_cells == notes_idx + 1:
+            notes = cell_texts[notes_idx].strip()
+        else:
+            notes = " ".join(cell_texts[notes_idx:]).strip()
+
+        return WarEvent(
+            start_year=start_year,
+            end_year=end_year if end_year is not None else start_year,
+            title=war_name,
+            belligerents=belligerents,
+            notes=notes,
+            source_url=source_url,
+            source_title=source_title
+        )
+
     def _parse_belligerents(self, text: str) -> list[str]:
         """Parse belligerents from text."""
         if not text:
             return []
 
-        # Split on common separators
-        separators = [r'\s+vs\.?\s+', r'\s+v\.?\s+', r'\s+versus\s+', r'\s*;\s*', r'\s*,\s*']
-        for sep in separators:
-            parts = re.split(sep, text, flags=re.IGNORECASE)
+        # If no separators found, treat as single belligerent; one scan
+        # rules out all of them at once
+        if not _ANY_BELLIGERENT_SEPARATOR_RE.search(text):
+            return [text.strip()]
+
+        # Split on the highest-priority separator present
+        for separator_re in _BELLIGERENT_SEPARATOR_RES:
+            parts = separator_re.split(text)
             if len(parts) > 1:
                 return [part.strip() for part in parts if part.strip()]
 
-        # If no separators found, treat as single belligerent
         return [text.strip()]
     
     def _clean_war_name(self, name: str) -> str:
@@ -58,26 +164,62 @@ class WarRowParserStrategy(ABC):
         if not name:
             return ""
 
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name.strip())
+        # Remove extra whitespace; str.split() uses the same Unicode
+        # whitespace as \s and needs no regex
+        name = ' '.join(name.split())
 
         # Remove citation markers like [1], [2], etc.
-        name = re.sub(r'\[\d+\]', '', name)
+        if '[' in name:
+            name = _CITATION_RE.sub('', name)
 
         return name
 
+    def _parse_year_from_text(self, text: str) -> int | None:
+        """Parse a year from text, handling various formats."""
+        if not text or (len(text) == _NO_YEAR_SENTINEL_LEN and text.lower() in _NO_YEAR_SENTINELS):
+            return None
+
+        # Extract numeric year, handling ranges and BC/AD
+        text = text.strip()
+
+        # Handle BC years; the text is BC if there was any marker to strip
+        text, bc_markers = _BC_RE.subn('', text)
+        is_bc = bc_markers > 0
+
+        # Handle AD years
+        text = _AD_RE.sub('', text)
+
+        # A bare number converts directly; otherwise extract the first number found
+        digits = text.strip()
+        if digits.isdecimal():
+            year = int(digits)
+            return -year if is_bc else year
+
+        match = _DIGITS_RE.search(text)
+        if match:
+            year = int(match.group())
+            return -year if is_bc else year
+
+        return None
+
 
 class MergedDateCellsStrategy(WarRowParserStrategy):
     """Strategy for tables with merged date cells (colspan='2' for date ranges)."""
 
+    signature_features = frozenset({'digit', 'dash'})
+    min_cells = 2
+
     def can_parse(self, cell_texts: list[str]) -> bool:
         """Check if first cell contains a date range (merged cells)."""
         if len(cell_texts) < 2:
             return False
 
         first_cell = cell_texts[0]
+        # A range needs a dash; skip the regex when there is none
+        if '-' not in first_cell and '–' not in first_cell:
+            return False
         # Look for explicit range patterns like "2300–2200" or "2300-2200"
-        return bool(re.search(r'\d{1,4}\s*[-–]\s*\d{1,4}', first_cell))
+        return bool(_YEAR_RANGE_RE.search(first_cell))
 
     def parse_row(self, cell_texts: list[str], source_url: str, source_title: str) -> Optional[WarEvent]:
         """Parse row with merged date cells."""
@@ -89,45 +231,37 @@ class MergedDateCellsStrategy(WarRowParserStrategy):
         if start_year is None:
             return None
 
-        war_name = cell_texts[1] if len(cell_texts) > 1 else ""
-        belligerents_start_idx = 2
-
-        # Clean up the war name
-        war_name = self._clean_war_name(war_name)
-
-        # Extract belligerents
-        belligerents = []
-        if len(cell_texts) > belligerents_start_idx:
-            belligerents_text = cell_texts[belligerents_start_idx]
-            belligerents = self._parse_belligerents(belligerents_text)
-
-        # Extract notes (remaining columns)
-        notes = ""
-        if len(cell_texts) > belligerents_start_idx + 1:
-            notes = " ".join(cell_texts[belligerents_start_idx + 1:]).strip()
-
-        return WarEvent(
-            start_year=start_year,
-            end_year=end_year if end_year is not None else start_year,
-            title=war_name,
-            belligerents=belligerents,
-            notes=notes,
-            source_url=source_url,
-            source_title=source_title
+        return self._build_event(
+            cell_texts, 1, start_year, end_year, source_url, source_title
         )
 
     def _parse_year_range_from_text(self, text: str) -> tuple[int | None, int | None]:
         """Parse start and end years from text that may contain a range."""
-        if not text or text.lower() in ['ongoing', 'present', 'current']:
+        if not text or (len(text) == _NO_YEAR_SENTINEL_LEN and text.lower() in _NO_YEAR_SENTINELS):
             return None, None
 
-        # Handle BC/AD markers
-        is_bc = 'bc' in text.lower()
-        text = re.sub(r'\s*bc\s*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*ad\s*', '', text, flags=re.IGNORECASE)
-
-        # Look for range patterns like "3400–3100" or "3400-3100"
-        range_match = re.search(r'(\d{1,4})\s*[-–]\s*(\d{1,4})', text)
+        # Handle BC/AD markers; the text is BC if there was any BC marker to strip
+        text, bc_markers = _BC_RE.subn('', text)
+        is_bc = bc_markers > 0
+        text = _AD_RE.sub('', text)
+
+        # Clean ranges like "3400–3100" split on the dash without the regex;
+        # both sides must be bare 1-4 digit years for the split to be exact
+        for separator in ('–', '-'):
+            left, found, right = text.partition(separator)
+            if found:
+                left = left.strip()
+                right = right.strip()
+                if (0 < len(left) <= 4 and 0 < len(right) <= 4
+                        and left.isdecimal() and right.isdecimal()):
+                    start_num = int(left)
+                    end_num = int(right)
+                    if is_bc:
+                        return -start_num, -end_num
+                    return start_num, end_num
+
+        # Look for range patterns like "3400–3100" or "3400-3100" in noisier text
+        range_match = _YEAR_RANGE_RE.search(text)
         if range_match:
             start_num = int(range_match.group(1))
             end_num = int(range_match.group(2))
@@ -135,8 +269,14 @@ class MergedDateCellsStrategy(WarRowParserStrategy):
             end_year = -end_num if is_bc else end_num
             return start_year, end_year
 
-        # Single year
-        match = re.search(r'\d{3,4}', text)
+        # Single year, converted directly when the cell is just the year
+        digits = text.strip()
+        if 3 <= len(digits) <= 4 and digits.isdecimal():
+            year = int(digits)
+            year = -year if is_bc else year
+            return year, year
+
+        match = _YEAR_3_4_RE.search(text)
         if match:
             year = int(match.group())
             year = -year if is_bc else year
@@ -144,55 +284,33 @@ class MergedDateCellsStrategy(WarRowParserStrategy):
 
         return None, None
 
-    def _clean_war_name(self, name: str) -> str:
-        """Clean up war name text."""
-        if not name:
-            return ""
-
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name.strip())
-
-        # Remove citation markers like [1], [2], etc.
-        name = re.sub(r'\[\d+\]', '', name)
-
-        return name
-
-    def _parse_belligerents(self, text: str) -> list[str]:
-        """Parse belligerents from text."""
-        if not text:
-            return []
-
-        # Split on common separators
-        separators = [r'\s+vs\.?\s+', r'\s+v\.?\s+', r'\s+versus\s+', r'\s*;\s*', r'\s*,\s*']
-        for sep in separators:
-            parts = re.split(sep, text, flags=re.IGNORECASE)
-            if len(parts) > 1:
-                return [part.strip() for part in parts if part.strip()]
-
-        # If no separators found, treat as single belligerent
-        return [text.strip()]
-
 
 class SingleDateSeparateColumnsStrategy(WarRowParserStrategy):
     """Strategy for tables with separate columns: date | war_name | belligerents."""
 
-    def _get_date_expression(self) -> str:
-        """Return regex expression for date length (3 or 4 digits)."""
-        return r'\d{3,4}'
+    signature_features = frozenset({'digit', 'era'})
+    min_cells = 3
+
+    # Date length (3 or 4 digits)
+    _DATE_RE = re.compile(r'\d{3,4}')
 
     def can_parse(self, cell_texts: list[str]) -> bool:
         """Check if this looks like separate date columns."""
         if len(cell_texts) < 3:
             return False
 
-        # First cell should contain a date (but not a range)
+        # First cell should contain a date (but not a range); without an
+        # era marker it can't, so skip the regex
         first_cell = cell_texts[0]
-        has_date = bool(re.search(self._get_date_expression(), first_cell)) and ('BC' in first_cell or 'AD' in first_cell or 'c.' in first_cell)
+        if 'BC' not in first_cell and 'AD' not in first_cell and 'c.' not in first_cell:
+            return False
+        if not self._DATE_RE.search(first_cell):
+            return False
 
         # Second cell should NOT be a date (should be the war name)
-        second_cell = cell_texts[1] if len(cell_texts) > 1 else ""
-        second_is_date = bool(re.search(self._get_date_expression(), second_cell)) and ('BC' in second_cell or 'AD' in second_cell)
-        return has_date and not second_is_date
+        second_cell = cell_texts[1]
+        second_is_date = ('BC' in second_cell or 'AD' in second_cell) and bool(self._DATE_RE.search(second_cell))
+        return not second_is_date
 
     def parse_row(self, cell_texts: list[str], source_url: str, source_title: str) -> Optional[WarEvent]:
         """Parse row with separate date columns."""
@@ -204,233 +322,89 @@ class SingleDateSeparateColumnsStrategy(WarRowParserStrategy):
         if start_year is None:
             return None
 
-        war_name = cell_texts[1]
-        belligerents_start_idx = 2
-
-        # Clean up the war name
-        war_name = self._clean_war_name(war_name)
-
-        # Extract belligerents
-        belligerents = []
-        if len(cell_texts) > belligerents_start_idx:
-            belligerents_text = cell_texts[belligerents_start_idx]
-            belligerents = self._parse_belligerents(belligerents_text)
-
-        # Extract notes (remaining columns)
-        notes = ""
-        if len(cell_texts) > belligerents_start_idx + 1:
-            notes = " ".join(cell_texts[belligerents_start_idx + 1:]).strip()
-
-        return WarEvent(
-            start_year=start_year,
-            end_year=start_year,  # Same as start
-            title=war_name,
-            belligerents=belligerents,
-            notes=notes,
-            source_url=source_url,
-            source_title=source_title
+        return self._build_event(
+            cell_texts, 1, start_year, start_year, source_url, source_title
         )
 
-    def _parse_year_from_text(self, text: str) -> int | None:
-        """Parse a year from text, handling various formats."""
-        if not text or text.lower() in ['ongoing', 'present', 'current']:
-            return None
-
-        # Extract numeric year, handling ranges and BC/AD
-        text = text.strip()
-
-        # Handle BC years
-        is_bc = 'bc' in text.lower()
-        text = re.sub(r'\s*bc\s*', '', text, flags=re.IGNORECASE)
-
-        # Handle AD years
-        text = re.sub(r'\s*ad\s*', '', text, flags=re.IGNORECASE)
-
-        # Extract first number found
-        match = re.search(r'\d+', text)
-        if match:
-            year = int(match.group())
-            return -year if is_bc else year
-
-        return None
-
-    def _clean_war_name(self, name: str) -> str:
-        """Clean up war name text."""
-        if not name:
-            return ""
-
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name.strip())
-
-        # Remove citation markers like [1], [2], etc.
-        name = re.sub(r'\[\d+\]', '', name)
-
-        return name
-
-    def _parse_belligerents(self, text: str) -> list[str]:
-        """Parse belligerents from text."""
-        if not text:
-            return []
-
-        # Split on common separators
-        separators = [r'\s+vs\.?\s+', r'\s+v\.?\s+', r'\s+versus\s+', r'\s*;\s*', r'\s*,\s*']
-        for sep in separators:
-            parts = re.split(sep, text, flags=re.IGNORECASE)
-            if len(parts) > 1:
-                return [part.strip() for part in parts if part.strip()]
-
-        # If no separators found, treat as single belligerent
-        return [text.strip()]
-
 class TwoDigitSingleDateSeparateColumnsStrategy(SingleDateSeparateColumnsStrategy):
     """Strategy for tables with separate columns: date (2 digits) | war_name | belligerents."""
 
-    def _get_date_expression(self) -> str:
-        """Return regex expression for date length (2 digits)."""
-        return r'\d{2}'
+    # Date length (2 digits)
+    _DATE_RE = re.compile(r'\d{2}')
 
 class TwoDateColumnsStrategy(WarRowParserStrategy):
     """Strategy for tables with: start_date | end_date | war_name | belligerents."""
 
+    signature_features = frozenset({'digit', 'era'})
+    min_cells = 4
+
     def can_parse(self, cell_texts: list[str]) -> bool:
         """Check if first two cells are dates."""
         if len(cell_texts) < 4:
             return False
 
         # First two cells should be dates
-        first_is_date = self._cell_is_date(cell_texts[0])
-        second_is_date = self._cell_is_date(cell_texts[1])
-
-        return first_is_date and second_is_date
+        cell_is_date = self._cell_is_date
+        return cell_is_date(cell_texts[0]) and cell_is_date(cell_texts[1])
 
-    def _get_date_expression(self) -> str:
-        """Return regex expression for date length (3 or 4 digits)."""
-        return r'\d{3,4}'
+    # Date length (3 or 4 digits)
+    _DATE_RE = re.compile(r'\d{3,4}')
 
     def _cell_is_date(self, cell_text: str) -> bool:
         """Check if a cell contains date-like content."""
-        return bool(re.search(self._get_date_expression(), cell_text)) and ('BC' in cell_text or 'AD' in cell_text or 'c.' in cell_text)
+        return ('BC' in cell_text or 'AD' in cell_text or 'c.' in cell_text) and bool(self._DATE_RE.search(cell_text))
 
     def parse_row(self, cell_texts: list[str], source_url: str, source_title: str) -> Optional[WarEvent]:
         """Parse row with two date columns."""
         if len(cell_texts) < 4:
             return None
 
-        # Parse start and end years
+        # Parse start and end years; the end year only matters once there is a start
         start_year = self._parse_year_from_text(cell_texts[0])
-        end_year = self._parse_year_from_text(cell_texts[1])
-
         if start_year is None:
             return None
+        end_year = self._parse_year_from_text(cell_texts[1])
 
-        war_name = cell_texts[2] if len(cell_texts) > 2 else ""
-        belligerents_start_idx = 3
-
-        # Clean up the war name
-        war_name = self._clean_war_name(war_name)
-
-        # Extract belligerents
-        belligerents = []
-        if len(cell_texts) > belligerents_start_idx:
-            belligerents_text = cell_texts[belligerents_start_idx]
-            belligerents = self._parse_belligerents(belligerents_text)
-
-        # Extract notes (remaining columns)
-        notes = ""
-        if len(cell_texts) > belligerents_start_idx + 1:
-            notes = " ".join(cell_texts[belligerents_start_idx + 1:]).strip()
-
-        return WarEvent(
-            start_year=start_year,
-            end_year=end_year if end_year is not None else start_year,
-            title=war_name,
-            belligerents=belligerents,
-            notes=notes,
-            source_url=source_url,
-            source_title=source_title
+        return self._build_event(
+            cell_texts, 2, start_year, end_year, source_url, source_title
         )
 
-    def _parse_year_from_text(self, text: str) -> int | None:
-        """Parse a year from text, handling various formats."""
-        if not text or text.lower() in ['ongoing', 'present', 'current']:
-            return None
-
-        # Extract numeric year, handling ranges and BC/AD
-        text = text.strip()
-
-        # Handle BC years
-        is_bc = 'bc' in text.lower()
-        text = re.sub(r'\s*bc\s*', '', text, flags=re.IGNORECASE)
-
-        # Handle AD years
-        text = re.sub(r'\s*ad\s*', '', text, flags=re.IGNORECASE)
-
-        # Extract first number found
-        match = re.search(r'\d+', text)
-        if match:
-            year = int(match.group())
-            return -year if is_bc else year
-
-        return None
-
-    def _clean_war_name(self, name: str) -> str:
-        """Clean up war name text."""
-        if not name:
-            return ""
-
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name.strip())
-
-        # Remove citation markers like [1], [2], etc.
-        name = re.sub(r'\[\d+\]', '', name)
-
-        return name
-
-    def _parse_belligerents(self, text: str) -> list[str]:
-        """Parse belligerents from text."""
-        if not text:
-            return []
-
-        # Split on common separators
-        separators = [r'\s+vs\.?\s+', r'\s+v\.?\s+', r'\s+versus\s+', r'\s*;\s*', r'\s*,\s*']
-        for sep in separators:
-            parts = re.split(sep, text, flags=re.IGNORECASE)
-            if len(parts) > 1:
-                return [part.strip() for part in parts if part.strip()]
-
-        # If no separators found, treat as single belligerent
-        return [text.strip()]
-
 class Post1000ADTwoDateColumnsStrategy(TwoDateColumnsStrategy):
+    signature_features = frozenset({'digit'})
+
     def _cell_is_date(self, cell_text: str) -> bool:
         """Check if a cell contains date-like content."""
-        return bool(re.search(self._get_date_expression(), cell_text))
+        return bool(self._DATE_RE.search(cell_text))
 
 class TwoDigitTwoDateColumnsStrategy(TwoDateColumnsStrategy):
     """Strategy for tables with: start_date (2 digits) | end_date (2 digits) | war_name | belligerents."""
 
-    def _get_date_expression(self) -> str:
-        """Return regex expression for date length (2 digits)."""
-        return r'\d{2}'
+    # Date length (2 digits)
+    _DATE_RE = re.compile(r'\d{2}')
 
 class OneDigitTwoDateColumnsStrategy(TwoDateColumnsStrategy):
     """Strategy for tables with: start_date (1 digit) | end_date (1 digit) | war_name | belligerents."""
 
-    def _get_date_expression(self) -> str:
-        """Return regex expression for date length (1 digit)."""
-        return r'\d{1,2}' 
+    # Date length (1 digit)
+    _DATE_RE = re.compile(r'\d{1,2}')
+
 # Strategy for ['Late 24th century BC', 'Formation of the Akkadian Empire[25]', 'Akkad Kish (after being conquered)']
 class CenturyDescriptorStrategy(WarRowParserStrategy):
     """Strategy for rows with century descriptors instead of specific years."""
 
+    signature_features = frozenset({'digit', 'century'})
+    min_cells = 2
+
     def can_parse(self, cell_texts: list[str]) -> bool:
         """Check if first cell contains a century descriptor."""
         if len(cell_texts) < 2:
             return False
 
         first_cell = cell_texts[0]
+        if 'century' not in first_cell.lower():
+            return False
         # Look for patterns like "Late 24th century BC"
-        return bool(re.search(r'(Early|Mid|Late)?\s*\d{1,2}(st|nd|rd|th)?\s*century\s*(BC|AD)?', first_cell, re.IGNORECASE))
+        return bool(_CENTURY_RE.search(first_cell))
 
     def parse_row(self, cell_texts: list[str], source_url: str, source_title: str) -> Optional[WarEvent]:
         """Parse row with century descriptor."""
@@ -442,52 +416,30 @@ class CenturyDescriptorStrategy(WarRowParserStrategy):
         if start_year is None:
             return None
 
-        war_name = cell_texts[1] if len(cell_texts) > 1 else ""
-        belligerents_start_idx = 2
-
-        # Clean up the war name
-        war_name = self._clean_war_name(war_name)
-
-        # Extract belligerents
-        belligerents = []
-        if len(cell_texts) > belligerents_start_idx:
-            belligerents_text = cell_texts[belligerents_start_idx]
-            belligerents = self._parse_belligerents(belligerents_text)
-
-        # Extract notes (remaining columns)
-        notes = ""
-        if len(cell_texts) > belligerents_start_idx + 1:
-            notes = " ".join(cell_texts[belligerents_start_idx + 1:]).strip()
-
-        return WarEvent(
-            start_year=start_year,
-            end_year=end_year if end_year is not None else start_year,
-            title=war_name,
-            belligerents=belligerents,
-            notes=notes,
-            source_url=source_url,
-            source_title=source_title
+        return self._build_event(
+            cell_texts, 1, start_year, end_year, source_url, source_title
         )
 
     def _parse_century_from_text(self, text: str) -> tuple[int | None, int | None]:
         """Parse start and end years from century descriptor."""
-        match = re.search(r'(Early|Mid|Late)?\s*(\d{1,2})(st|nd|rd|th)?\s*century\s*(BC|AD)?', text, re.IGNORECASE)
+        match = _CENTURY_RE.search(text)
         if not match:
             return None, None
-        period = match.group(1)
-        century_num = int(match.group(2))
-        era = match.group(4)
-        is_bc = era and era.lower() == 'bc'
-        # Calculate start and end years of the century
-
-        if is_bc:
-            start_year, end_year = self._calculate_bc_century_years(century_num, period)
-        else:
-            start_year, end_year = self._calculate_ad_century_years(century_num, period)
-
-        return start_year, end_year
-    
-    def _calculate_ad_century_years(self, century: int, period: str | None) -> tuple[int, int]:
+        period, century, _, era = match.groups()
+        is_bc = era is not None and era.lower() == 'bc'
+        century_num = int(century)
+        # Look up the precomputed start and end years of the century
+        years = _CENTURY_YEARS.get((is_bc, century_num, period.lower() if period else None))
+        if years is None:
+            # A period that only matches case-insensitively, like "Mıd", lowers
+            # to something other than early/mid/late; compute it directly
+            if is_bc:
+                return self._calculate_bc_century_years(century_num, period)
+            return self._calculate_ad_century_years(century_num, period)
+        return years
+
+    @staticmethod
+    def _calculate_ad_century_years(century: int, period: str | None) -> tuple[int, int]:
         """Calculate AD century start and end years."""
         start_year = (century - 1) * 100 + 1
         end_year = century * 100
@@ -502,7 +454,8 @@ class CenturyDescriptorStrategy(WarRowParserStrategy):
                 start_year += 67
         return start_year, end_year
     
-    def _calculate_bc_century_years(self, century: int, period: str | None) -> tuple[int, int]:
+    @staticmethod
+    def _calculate_bc_century_years(century: int, period: str | None) -> tuple[int, int]:
         """Calculate BC century start and end years."""
 
         """"
@@ -537,18 +490,38 @@ class CenturyDescriptorStrategy(WarRowParserStrategy):
                 start_year += 67
         return start_year, end_year
     
+
+# Years for every (is_bc, century, period) _CENTURY_RE yields for ASCII-cased
+# periods; centuries are one or two digits and periods are lowercased.
+_CENTURY_YEARS = {
+    (is_bc, century, period): (
+        CenturyDescriptorStrategy._calculate_bc_century_years(century, period)
+        if is_bc else
+        CenturyDescriptorStrategy._calculate_ad_century_years(century, period)
+    )
+    for is_bc in (False, True)
+    for century in range(100)
+    for period in (None, 'early', 'mid', 'late')
+}
+
+
 # Parenthetical "between" ranges like (Between 753 and 716 BC) 
 class ParentheticalBetweenRangeStrategy(WarRowParserStrategy):
     """Strategy for rows with parenthetical 'between' date ranges."""
 
+    signature_features = frozenset({'digit', 'between'})
+    min_cells = 2
+
     def can_parse(self, cell_texts: list[str]) -> bool:
         """Check if first cell contains a parenthetical 'between' range."""
         if len(cell_texts) < 2:
             return False
 
         first_cell = cell_texts[0]
+        if '(' not in first_cell or 'between' not in first_cell.lower():
+            return False
         # Look for patterns like "(Between 753 and 716 BC)"
-        return bool(re.search(r'\(Between\s+\d{1,4}\s+and\s+\d{1,4}\s*(BC|AD)?\)', first_cell, re.IGNORECASE))
+        return bool(_BETWEEN_RE.search(first_cell))
 
     def parse_row(self, cell_texts: list[str], source_url: str, source_title: str) -> Optional[WarEvent]:
         """Parse row with parenthetical 'between' range."""
@@ -560,36 +533,13 @@ class ParentheticalBetweenRangeStrategy(WarRowParserStrategy):
         if start_year is None:
             return None
 
-        war_name = cell_texts[1] if len(cell_texts) > 1 else ""
-        belligerents_start_idx = 2
-
-        # Clean up the war name
-        war_name = self._clean_war_name(war_name)
-
-        # Extract belligerents
-        belligerents = []
-        if len(cell_texts) > belligerents_start_idx:
-            belligerents_text = cell_texts[belligerents_start_idx]
-            belligerents = self._parse_belligerents(belligerents_text)
-
-        # Extract notes (remaining columns)
-        notes = ""
-        if len(cell_texts) > belligerents_start_idx + 1:
-            notes = " ".join(cell_texts[belligerents_start_idx + 1:]).strip()
-
-        return WarEvent(
-            start_year=start_year,
-            end_year=end_year if end_year is not None else start_year,
-            title=war_name,
-            belligerents=belligerents,
-            notes=notes,
-            source_url=source_url,
-            source_title=source_title
+        return self._build_event(
+            cell_texts, 1, start_year, end_year, source_url, source_title
         )
     
     def _parse_between_range_from_text(self, text: str) -> tuple[int | None, int | None]:
         """Parse start and end years from parenthetical 'between' range."""
-        match = re.search(r'\(Between\s+(\d{1,4})\s+and\s+(\d{1,4})\s*(BC|AD)?\)', text, re.IGNORECASE)
+        match = _BETWEEN_RE.search(text)
         if not match:
             return None, None
 
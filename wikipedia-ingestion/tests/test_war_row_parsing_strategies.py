@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import Mock
 
 from strategies.wars.war_row_parsing_strategies import (
+    CenturyDescriptorStrategy,
     MergedDateCellsStrategy,
     SingleDateSeparateColumnsStrategy,
     TwoDateColumnsStrategy,
@@ -48,6 +49,29 @@ class TestMergedDateCellsStrategy:
         assert result is not None
         assert result.notes == "Some notes"
 
+    def test_parse_joins_multiple_notes_columns(self):
+        """Test every column after the belligerents is joined into notes."""
+        cell_texts = ["2300–2200 BC", "Mari-Ebla War", "Ebla vs Mari", "Some notes", "More notes "]
+        result = self.strategy.parse_row(cell_texts, "http://test.com", "Test Page")
+
+        assert result is not None
+        assert result.notes == "Some notes More notes"
+
+    def test_parse_year_range_from_noisy_text(self):
+        """Test ranges embedded in other text still parse like clean ranges."""
+        assert self.strategy._parse_year_range_from_text("1939 - 1945") == (1939, 1945)
+        assert self.strategy._parse_year_range_from_text("c. 1618–1648 (Europe)") == (1618, 1648)
+
+    def test_parse_belligerents_uses_highest_priority_separator(self):
+        """Test 'vs' wins over commas, which stay inside each side."""
+        belligerents = self.strategy._parse_belligerents("Rome, Latins vs Carthage")
+
+        assert belligerents == ["Rome, Latins", "Carthage"]
+
+    def test_parse_belligerents_without_separator(self):
+        """Test text with no separator is a single belligerent."""
+        assert self.strategy._parse_belligerents(" Akkad ") == ["Akkad"]
+
 
 class TestSingleDateSeparateColumnsStrategy:
     """Test the single date separate columns strategy."""
@@ -107,6 +131,23 @@ class TestTwoDateColumnsStrategy:
         assert result.belligerents == ["Ebla", "Mari"]
 
 
+class TestCenturyDescriptorStrategy:
+    """Test the century descriptor strategy."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.strategy = CenturyDescriptorStrategy()
+
+    def test_parse_century_with_period(self):
+        """Test a period narrows the century to a third of it."""
+        assert self.strategy._parse_century_from_text("Mid 2nd century BC") == (-67, -35)
+
+    @pytest.mark.parametrize("text", ["Mıd 2nd century BC", "MİD 2nd century BC"])
+    def test_parse_century_with_non_ascii_period(self, text):
+        """Test a period that only matches case-insensitively spans the whole century."""
+        assert self.strategy._parse_century_from_text(text) == (-101, -200)
+
+
 class TestWarRowParserFactory:
     """Test the parser factory."""
 
@@ -135,9 +176,33 @@ class TestWarRowParserFactory:
 
         assert isinstance(parser, TwoDateColumnsStrategy)
 
+    def test_get_parser_reuses_choice_for_same_leading_cells(self):
+        """Test rows sharing length and first two cells skip can_parse after the first."""
+        first = self.factory.get_parser(["2300 BC", "Mari-Ebla War", "Ebla vs Mari"])
+        for strategy in self.factory.strategies:
+            strategy.can_parse = Mock(side_effect=AssertionError("parser choice was not cached"))
+
+        assert self.factory.get_parser(["2300 BC", "Mari-Ebla War", "Akkad"]) is first
+
     def test_get_parser_no_match(self):
         """Test factory returns None when no strategy matches."""
         cell_texts = ["Not a date", "Also not a date", "Still not"]
         parser = self.factory.get_parser(cell_texts)
 
-        assert parser is None
\ No newline at end of file
+        assert parser is None
+
+    @pytest.mark.parametrize("cell_texts", [
+        ["(Between 753 and 716 BC)", "Roman-Sabine war", "Rome; Sabines"],
+        ["Late 24th century BC", "Formation of the Akkadian Empire", "Akkad Kish"],
+        ["1939", "1945", "World War II", "Allies vs Axis"],
+        ["1939–1945", "World War II"],
+        ["753 BC", "Founding war"],
+        ["c. 50", "c. 60", "Some war", "A; B"],
+        ["", "Empty first cell", "Nobody"],
+        [],
+    ])
+    def test_get_parser_matches_linear_scan(self, cell_texts):
+        """Test signature dispatch picks the same strategy as scanning every strategy."""
+        expected = next((s for s in self.factory.strategies if s.can_parse(cell_texts)), None)
+
+        assert self.factory.get_parser(cell_texts) is expected